@@ -7,38 +7,42 @@ from typing import Optional
 
 __all__ = ["open_file", "show_message", "get_active_model"]
 
-try:
-    # Replace with the real Cursor SDK import when available
-    import cursor_api as _cursor
-
-    _HAS_CURSOR = True
-except ImportError:
-    _HAS_CURSOR = False
-
 # --------------------------------------------------------------------------- #
-# Public helpers                                                              #
+# Public helpers (headless defaults)                                          #
 # --------------------------------------------------------------------------- #
 
 
 def open_file(path: str) -> None:
     """Open a file in the editor (NO-OP in headless mode)."""
 
-    if _HAS_CURSOR:
-        _cursor.open_file(path)  # type: ignore[attr-defined]
-
 
 def show_message(msg: str) -> None:
     """Display an informational message to the user/IDE."""
 
-    if _HAS_CURSOR:
-        _cursor.show_message(msg)  # type: ignore[attr-defined]
-    else:
-        print(f"[AGENT] {msg}")
+    print(f"[AGENT] {msg}")
 
 
 def get_active_model() -> Optional[str]:
     """Return the IDE-selected LLM model or None if not available."""
 
-    if _HAS_CURSOR:
-        return _cursor.get_active_model()  # type: ignore[attr-defined]
     return None
+
+
+# --------------------------------------------------------------------------- #
+# Cursor bindings                                                             #
+# --------------------------------------------------------------------------- #
+# Resolve the SDK functions once at import time and rebind the public names
+# to them, so each call is a direct invocation rather than a flag check plus
+# an attribute lookup on the module.
+
+try:
+    # Replace with the real Cursor SDK import when available
+    import cursor_api as _cursor
+
+    _HAS_CURSOR = True
+except ImportError:
+    _HAS_CURSOR = False
+else:
+    open_file = getattr(_cursor, "open_file", open_file)
+    show_message = getattr(_cursor, "show_message", show_message)
+    get_active_model = getattr(_cursor, "get_active_model", get_active_model)
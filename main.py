@@ -1,22 +1,29 @@
 # main.py
-import json
+from __future__ import annotations
+
+import hashlib
 import logging
 import sys
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
+from joblib import Memory
 
 # --------------------------------------------------------------------------- #
 # Project imports                                                             #
 # --------------------------------------------------------------------------- #
-from src.config import settings  # configuration / secrets
-from src.data_processing import ensure_raw_data_exists, process_all_data
-from src.diagnostics import run_residual_diagnostics, run_structural_break_tests
-from src.eda import run_stationarity_tests, winsorize_data
-from src.ols_models import run_ols_benchmarks
-from src.reporting import NpEncoder, generate_summary
-from src.ts_models import run_ardl_analysis, run_vecm_analysis
-from src.validation import run_oos_validation
+# Only configuration is imported eagerly (and is itself built on first use).
+# The analysis modules pull in pandas, statsmodels, scipy and matplotlib, so
+# each stage imports what it needs just before it runs; the CLI pre-flight
+# checks then return without paying for them.
+from src.config import get_settings  # configuration / secrets
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # --------------------------------------------------------------------------- #
 # Local constants (previously in config)                                      #
@@ -42,9 +49,171 @@ OOS_WINDOW = 60  # 5 years of monthly data
 OOS_ENDOG_COL = "price_usd"
 OOS_EXOG_COLS = ["active_addr", "tx_count", "nasdaq"]
 
+MODEL_WORKERS = 4  # one process per independent model stage
+# Starting workers costs ~1-2 s where they re-import pandas/statsmodels (the
+# spawn start method on macOS/Windows); on the ~10 years of monthly rows the
+# project has, the stages finish sooner in-process, so only fan out above this
+MODEL_POOL_MIN_ROWS = 240
+CACHE_DIRNAME = ".joblib_cache"  # under settings.DATA_DIR
+# Keys roll over daily, so old entries are pruned instead of piling up
+CACHE_BYTES_LIMIT = "500M"
+CACHE_AGE_LIMIT = timedelta(days=14)
+RAW_DATA_FILENAMES = (
+    "eth_core.parquet",
+    "eth_tx.parquet",
+    "eth_fee.parquet",
+    "nasdaq_ndx.feather",
+)
+
+# Sources whose code feeds each memoized stage (globs relative to src/). joblib
+# only hashes the memoized function itself, not what it calls.
+SRC_DIR = Path(__file__).resolve().parent / "src"
+OOS_SOURCES = ("validation.py", "eda.py", "ts_models.py")
+PROCESSING_SOURCES = (
+    "config.py",
+    "data_processing.py",
+    "data_fetching.py",
+    "utils/*.py",
+)
+
 RESULTS_JSON_FILENAME = "final_results.json"
 RAW_PLOT_FILENAME = "raw_core_data_plot.png"
 
+# --------------------------------------------------------------------------- #
+# Stage helpers                                                               #
+# --------------------------------------------------------------------------- #
+
+
+@lru_cache(maxsize=1)
+def _memory() -> Memory:
+    """Disk memoizer for deterministic stages, rooted under ``DATA_DIR``.
+
+    joblib hashes the *content* of every argument (frames included) plus the
+    memoized function's own code, so a changed input or parameter invalidates
+    the entry automatically. Code it *calls* is not hashed; stages pass a
+    ``_source_fingerprint`` of their modules as an argument to cover that.
+
+    Entries older than ``CACHE_AGE_LIMIT`` are dropped, then the oldest ones
+    until the directory fits in ``CACHE_BYTES_LIMIT``; deleting the
+    ``.joblib_cache`` directory is always a safe way to start cold.
+    """
+    memory = Memory(location=get_settings().DATA_DIR / CACHE_DIRNAME, verbose=0)
+    memory.reduce_size(bytes_limit=CACHE_BYTES_LIMIT, age_limit=CACHE_AGE_LIMIT)
+    return memory
+
+
+@lru_cache(maxsize=None)
+def _source_fingerprint(patterns: tuple[str, ...]) -> str:
+    """SHA-256 over the project sources matching *patterns* (globs under src/)."""
+    digest = hashlib.sha256()
+    for pattern in patterns:
+        for path in sorted(SRC_DIR.glob(pattern)):
+            digest.update(path.relative_to(SRC_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _raw_data_key() -> tuple[Any, ...]:
+    """Cache key for ``process_all_data``: raw-input mtimes, code and date.
+
+    ``process_all_data`` takes no arguments, so its inputs are identified by
+    the modification times of the raw parquet files, and its code by a
+    fingerprint of the modules it runs. NASDAQ is refreshed from a 24h disk
+    cache inside the call, hence the key also rolls over daily.
+    """
+    mtimes = tuple(
+        path.stat().st_mtime if path.exists() else None
+        for path in (get_settings().DATA_DIR / name for name in RAW_DATA_FILENAMES)
+    )
+    return (
+        *mtimes,
+        _source_fingerprint(PROCESSING_SOURCES),
+        date.today().isoformat(),
+    )
+
+
+def _process_all_data_keyed(
+    raw_data_key: tuple[Any, ...],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """``process_all_data`` keyed on ``_raw_data_key()`` for memoization."""
+    from src.data_processing import process_all_data
+
+    return process_all_data()
+
+
+def _load_processed_data() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Memoized ``process_all_data``; empty frames if processing failed.
+
+    A failed (empty) result is not kept in the cache. A cache hit skips
+    ``process_all_data``'s own writes, so the processed parquet files that
+    other scripts read are re-emitted from the cached frames.
+    """
+    from src.data_processing import save_processed_data
+
+    cached_process_all_data = _memory().cache(_process_all_data_keyed)
+    raw_data_key = _raw_data_key()
+    cache_hit = cached_process_all_data.check_call_in_cache(raw_data_key)
+    processed = cached_process_all_data.call_and_shelve(raw_data_key)
+    daily_clean, monthly_clean = processed.get()
+    if daily_clean.empty or monthly_clean.empty:
+        processed.clear()  # only this entry; other cached runs are kept
+    elif cache_hit:
+        save_processed_data(daily_clean, monthly_clean)
+    return daily_clean, monthly_clean
+
+
+def _oos_validation_keyed(code_key: str, **kwargs: Any) -> dict[str, Any]:
+    """``run_oos_validation`` keyed on ``_source_fingerprint(OOS_SOURCES)``.
+
+    *code_key* is unused here; it only makes joblib invalidate the memoized
+    result when the validation, EDA or model code it runs changes.
+    """
+    from src.validation import run_oos_validation
+
+    return run_oos_validation(**kwargs)
+
+
+StageTask = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+def _run_stages(tasks: dict[str, StageTask], parallel: bool) -> dict[str, Any]:
+    """Run independent stage callables, in a process pool if *parallel*.
+
+    Each worker receives its own pickled copy of the inputs; in-process, the
+    stages run one after another on the caller's frames.
+    """
+    results: dict[str, Any] = {}
+    if not parallel:
+        for name, (fn, args, kwargs) in tasks.items():
+            results[name] = fn(*args, **kwargs)
+            logging.info("Stage '%s' finished.", name)
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(MODEL_WORKERS, len(tasks))) as pool:
+        futures = {
+            pool.submit(fn, *args, **kwargs): name
+            for name, (fn, args, kwargs) in tasks.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            logging.info("Stage '%s' finished.", futures[future])
+    return results
+
+
+def _run_ols_stage(
+    daily_df: pd.DataFrame, monthly_df: pd.DataFrame
+) -> tuple[dict[str, Any], pd.DataFrame]:
+    """Run the OLS benchmarks and hand back the frame they annotate.
+
+    ``run_ols_benchmarks`` adds the fair-value columns to *monthly_df* in
+    place; inside a worker process that mutation would be lost, so the
+    annotated frame is returned alongside the results.
+    """
+    from src.ols_models import run_ols_benchmarks
+
+    return run_ols_benchmarks(daily_df, monthly_df), monthly_df
+
+
 # --------------------------------------------------------------------------- #
 # Main pipeline                                                               #
 # --------------------------------------------------------------------------- #
@@ -56,6 +225,8 @@ def main() -> None:
 
     # 0 ─ Ensure raw data is present (download if required)
     logging.info("--- Checking/Fetching Raw Data ---")
+    from src.data_processing import ensure_raw_data_exists
+
     if not ensure_raw_data_exists(plot_diagnostics=True, filename=RAW_PLOT_FILENAME):
         logging.error("Could not ensure raw data is available. Exiting.")
         sys.exit(1)
@@ -64,7 +235,7 @@ def main() -> None:
 
     # 1 ─ Data processing
     logging.info("--- Running Data Processing ---")
-    daily_clean, monthly_clean = process_all_data()
+    daily_clean, monthly_clean = _load_processed_data()
     if daily_clean.empty or monthly_clean.empty:
         logging.error("Data processing failed or returned empty dataframes. Exiting.")
         sys.exit(1)
@@ -76,39 +247,112 @@ def main() -> None:
         "monthly_end": monthly_clean.index.max(),
     }
 
-    monthly_clean_original = monthly_clean.copy()
-    monthly_clean_for_ols = monthly_clean.copy()
+    # 2 ─ Pre-model EDA: winsorise (stationarity tests run with the models)
+    logging.info("--- Winsorising ---")
+    from src.eda import run_stationarity_tests, winsorize_data
 
-    # 2 ─ Pre-model EDA: winsorise + stationarity tests
-    logging.info("--- Winsorising & Stationarity Tests ---")
     monthly_winsorized = winsorize_data(
-        df=monthly_clean_original,
+        df=monthly_clean,  # winsorize_data returns a new frame
         cols_to_cap=WINSORIZE_COLS,
         quantile=WINSORIZE_QUANTILE,
         window_mask=None,  # whole data set
     )
-    monthly_winsorized.replace([np.inf, -np.inf], np.nan, inplace=True)
+    # Null out +/-inf with one vectorised pass over the float block (only float
+    # columns can hold inf, so integer/object columns are skipped entirely)
+    float_cols = monthly_winsorized.select_dtypes(include=[np.floating]).columns
+    inf_mask = np.isinf(monthly_winsorized[float_cols].to_numpy())
+    if inf_mask.any():
+        monthly_winsorized[float_cols] = monthly_winsorized[float_cols].mask(inf_mask)
 
-    analysis_results["stationarity"] = run_stationarity_tests(
-        df=monthly_winsorized,
-        cols_to_test=STATIONARITY_COLS,
-        window_mask=None,
-    )
+    # 3 ─ Stationarity tests, modelling & diagnostics
+    logging.info("--- Running Stationarity Tests & Models ---")
+    from src.ts_models import run_ardl_analysis, run_vecm_analysis
+
+    # Rolling OOS validation refits a model per window and dominates run time.
+    cached_oos_validation = _memory().cache(_oos_validation_keyed)
 
-    # 3 ─ Modelling & diagnostics
-    logging.info("--- Running Models ---")
-    model_df = monthly_winsorized.dropna(
-        subset=[ARDL_ENDOG_COL, *ARDL_EXOG_COLS]
-    ).copy()
+    model_df = monthly_winsorized.dropna(subset=[ARDL_ENDOG_COL, *ARDL_EXOG_COLS])
     if model_df.empty:
         logging.error("No data left after NaN drop. Exiting.")
         sys.exit(1)
 
-    # 3a OLS
-    ols_results = run_ols_benchmarks(daily_clean, monthly_clean_for_ols)
+    # The stationarity tests and model stages 3a-3d only read the frames built
+    # above and are independent of each other, so they are run as one batch;
+    # with enough data, as concurrent worker processes. ``_run_ols_stage``
+    # hands back the frame it annotates, so this works either way.
+    vecm_req = VECM_ENDOG_COLS + VECM_EXOG_COLS
+    ardl_req = [ARDL_ENDOG_COL, *ARDL_EXOG_COLS]
+    oos_req = [OOS_ENDOG_COL, *OOS_EXOG_COLS, "price_usd", "supply"]
+    model_cols = frozenset(model_df.columns)
+    winsorized_cols = frozenset(monthly_winsorized.columns)
+
+    stage_results: dict[str, Any] = {}
+    tasks: dict[str, StageTask] = {
+        "stationarity": (
+            run_stationarity_tests,
+            (),
+            {
+                "df": monthly_winsorized,
+                "cols_to_test": STATIONARITY_COLS,
+                "window_mask": None,
+            },
+        ),
+        "ols": (_run_ols_stage, (daily_clean, monthly_clean), {}),
+    }
+
+    # 3b VECM
+    missing = set(vecm_req) - model_cols
+    if missing:
+        stage_results["vecm"] = {"error": f"Missing columns: {missing}"}
+    else:
+        tasks["vecm"] = (
+            run_vecm_analysis,
+            (model_df, VECM_ENDOG_COLS, VECM_EXOG_COLS),
+            {},
+        )
+
+    # 3c ARDL
+    missing = set(ardl_req) - model_cols
+    if missing:
+        stage_results["ardl"] = {"error": f"Missing columns: {missing}"}
+    else:
+        tasks["ardl"] = (
+            run_ardl_analysis,
+            (model_df, ARDL_ENDOG_COL, ARDL_EXOG_COLS),
+            {},
+        )
+
+    # 3d OOS validation
+    missing = set(oos_req) - winsorized_cols
+    if missing:
+        stage_results["oos"] = {"error": f"Missing columns: {missing}"}
+    else:
+        tasks["oos"] = (
+            cached_oos_validation,
+            (_source_fingerprint(OOS_SOURCES),),
+            {
+                "df_monthly": monthly_winsorized,
+                "endog_col": OOS_ENDOG_COL,
+                "exog_cols": OOS_EXOG_COLS,
+                "winsorize_cols": WINSORIZE_COLS,
+                "winsorize_quantile": WINSORIZE_QUANTILE,
+                "stationarity_cols": STATIONARITY_COLS,
+                "window_size": OOS_WINDOW,
+            },
+        )
+
+    stage_results.update(
+        _run_stages(tasks, parallel=len(monthly_winsorized) >= MODEL_POOL_MIN_ROWS)
+    )
+
+    analysis_results["stationarity"] = stage_results["stationarity"]
+
+    # 3a OLS (+ diagnostics on the extended fit, if available)
+    from src.diagnostics import run_residual_diagnostics, run_structural_break_tests
+
+    ols_results, monthly_with_fv = stage_results["ols"]
     analysis_results["ols"] = ols_results
 
-    # Diagnostics on extended OLS, if available
     ols_ext_fit = ols_results.get("monthly_extended", {})
     if ols_ext_fit.get("model_obj"):
         analysis_results["ols_diagnostics"] = run_residual_diagnostics(ols_ext_fit)
@@ -119,51 +363,27 @@ def main() -> None:
         analysis_results["ols_diagnostics"] = {"error": "Extended OLS failed"}
         analysis_results["ols_structural_breaks"] = {"error": "Extended OLS failed"}
 
-    # 3b VECM
-    vecm_req = VECM_ENDOG_COLS + VECM_EXOG_COLS
-    if all(c in model_df.columns for c in vecm_req):
-        analysis_results["vecm"] = run_vecm_analysis(
-            model_df, VECM_ENDOG_COLS, VECM_EXOG_COLS
-        )
-    else:
-        missing = set(vecm_req) - set(model_df.columns)
-        analysis_results["vecm"] = {"error": f"Missing columns: {missing}"}
-
-    # 3c ARDL
-    ardl_req = [ARDL_ENDOG_COL, *ARDL_EXOG_COLS]
-    if all(c in model_df.columns for c in ardl_req):
-        analysis_results["ardl"] = run_ardl_analysis(
-            model_df, ARDL_ENDOG_COL, ARDL_EXOG_COLS
-        )
-    else:
-        missing = set(ardl_req) - set(model_df.columns)
-        analysis_results["ardl"] = {"error": f"Missing columns: {missing}"}
-
-    # 3d OOS validation
-    oos_req = [OOS_ENDOG_COL, *OOS_EXOG_COLS, "price_usd", "supply"]
-    if all(c in monthly_winsorized.columns for c in oos_req):
-        oos_results = run_oos_validation(
-            df_monthly=monthly_winsorized,
-            endog_col=OOS_ENDOG_COL,
-            exog_cols=OOS_EXOG_COLS,
-            winsorize_cols=WINSORIZE_COLS,
-            winsorize_quantile=WINSORIZE_QUANTILE,
-            stationarity_cols=STATIONARITY_COLS,
-            window_size=OOS_WINDOW,
-        )
-        analysis_results["oos"] = oos_results
-        if "predictions_df" in oos_results:
-            preds_df = oos_results["predictions_df"]
-            model_df["predicted_price_oos"] = preds_df["predicted_price_oos"].reindex(
-                model_df.index
+    analysis_results["vecm"] = stage_results["vecm"]
+    analysis_results["ardl"] = stage_results["ardl"]
+
+    oos_results = stage_results["oos"]
+    analysis_results["oos"] = oos_results
+    if "predictions_df" in oos_results:
+        preds_df = oos_results["predictions_df"]
+        # Same index -> take the values as-is; otherwise align once via a join.
+        if model_df.index.equals(preds_df.index):
+            # assign() rebinds instead of writing into the (uncopied) dropna result
+            model_df = model_df.assign(
+                predicted_price_oos=preds_df["predicted_price_oos"].to_numpy()
             )
-    else:
-        missing = set(oos_req) - set(monthly_winsorized.columns)
-        analysis_results["oos"] = {"error": f"Missing columns: {missing}"}
+        else:
+            model_df = model_df.join(preds_df[["predicted_price_oos"]], how="left")
 
     # 4 ─ Reporting
     logging.info("--- Generating Report ---")
-    summary = generate_summary(analysis_results, monthly_clean_for_ols, model_df)
+    from src.reporting import generate_summary, write_results_json
+
+    summary = generate_summary(analysis_results, monthly_with_fv, model_df)
     final_results = summary["final_dict"]
     interpretation_text = summary["interpretation_text"]
 
@@ -171,10 +391,9 @@ def main() -> None:
     print(interpretation_text)
     print("=" * 80 + "\n")
 
-    results_path = settings.DATA_DIR / RESULTS_JSON_FILENAME
+    results_path = get_settings().DATA_DIR / RESULTS_JSON_FILENAME
     try:
-        with open(results_path, "w") as fp:
-            json.dump(final_results, fp, indent=4, cls=NpEncoder)
+        write_results_json(final_results, results_path)
         logging.info("Final results saved to %s", results_path)
     except Exception as exc:  # pragma: no cover
         logging.error("Failed to save results JSON: %s", exc, exc_info=True)
@@ -186,7 +405,7 @@ def main() -> None:
 # CLI entry-point                                                             #
 # --------------------------------------------------------------------------- #
 if __name__ == "__main__":
-    if not settings.RAPIDAPI_KEY:
+    if not get_settings().RAPIDAPI_KEY:
         logging.error("RAPIDAPI_KEY environment variable not set. Exiting.")
         sys.exit(1)
 
@@ -5,9 +5,9 @@ import logging
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from src.config import settings  # Import settings object
+from src.config import get_settings
 
-DATA_DIR = settings.DATA_DIR  # Get DATA_DIR from settings
+DATA_DIR = get_settings().DATA_DIR
 
 logging.info("--- Interactive Session: Loading Data ---")
 
@@ -46,17 +46,19 @@ logging.info("--- Interactive Session: Plotting ---")
 # Check if the variables exist in the interactive session's memory
 if "monthly_clean" in locals() and isinstance(monthly_clean, pd.DataFrame):
     # Check if the fair value columns were added (e.g., from a previous OLS run if you adapt this later)
-    plot_cols = ["price_usd"]
-    if "fair_price_ext" in monthly_clean.columns:
-        plot_cols.append("fair_price_ext")
-    if "fair_price_base" in monthly_clean.columns:
-        plot_cols.append("fair_price_base")
+    # Slice the in-memory frame so edits made in earlier cells are plotted
+    plot_cols = [
+        c
+        for c in ("price_usd", "fair_price_ext", "fair_price_base")
+        if c in monthly_clean.columns
+    ]
+    plot_df = monthly_clean[plot_cols]
 
     if len(plot_cols) > 1:
         logging.info(f"Plotting columns: {plot_cols}")
         try:
             plot_title = "Monthly ETH Price vs Model Fair Values (Log Scale)"
-            monthly_clean[plot_cols].plot(
+            plot_df[plot_cols].plot(
                 figsize=(12, 6),
                 logy=True,
                 title=plot_title,
@@ -75,7 +77,7 @@ if "monthly_clean" in locals() and isinstance(monthly_clean, pd.DataFrame):
         )
         try:
             price_plot_title = "Monthly ETH Price (Log Scale)"
-            monthly_clean["price_usd"].plot(
+            plot_df["price_usd"].plot(
                 figsize=(12, 6),
                 logy=True,
                 title=price_plot_title,
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """
-Back-fill `.meta.json` files for existing Parquet caches.
+Back-fill `.meta.json` files for existing Parquet and Feather caches.
 
 Usage
 -----
@@ -10,7 +10,7 @@ If <cache_directory> is omitted, the script defaults to
 `settings.DATA_DIR` (the same root used by `disk_cache`).
 
 The script walks the directory tree recursively, ensuring that every
-`*.parquet` file has a sibling `*.meta.json`.  The metadata contains:
+`*.parquet` / `*.feather` file has a sibling `*.meta.json`.  The metadata contains:
 
     {
         "pandas_type": "Series" | "DataFrame",
@@ -23,12 +23,16 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
 # re-add pandas import for pd.read_parquet and pd.Series/DateFrame usage
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Attempt to import project settings for default cache location
 try:
@@ -37,62 +41,111 @@ try:
 except ImportError:  # Fallback when running outside project root
     DATA_DIR = Path.cwd()
 
+# Suffixes written by `disk_cache`
+CACHE_SUFFIXES = (".parquet", ".feather")
+
 logging.basicConfig(
     format="%(levelname)s: %(message)s",
     level=logging.INFO,
 )
 
 
-def parquet_files(root: Path) -> Iterable[Path]:
-    """Yield all `.parquet` files under *root* (recursively)."""
-    yield from root.rglob("*.parquet")
-
-
-def write_meta(pq_path: Path, overwrite: bool = False) -> None:
-    """Create or update the metadata file adjacent to *pq_path*."""
-    meta_path = pq_path.with_suffix(".meta.json")
+def cache_files(root: Path) -> Iterable[Path]:
+    """Yield all `.parquet` / `.feather` files under *root* (recursively)."""
+    if not root.is_dir():
+        return
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from cache_files(Path(entry.path))
+            elif entry.name.endswith(CACHE_SUFFIXES) and entry.is_file():
+                yield Path(entry.path)
+
+
+def infer_pandas_type(cache_path: Path) -> str:
+    """Infer "Series" / "DataFrame" from the file's schema alone.
+
+    pandas stores a JSON blob under the ``b"pandas"`` schema metadata key, so
+    the answer can be read from the Parquet footer (or the Feather/Arrow IPC
+    schema) without touching any data.  Files written by other tools lack that
+    key and fall back to reading a single column.
+    """
+    if cache_path.suffix == ".feather":
+        with pa.memory_map(str(cache_path)) as source:
+            schema = pa.ipc.open_file(source).schema
+    else:
+        schema = pq.ParquetFile(cache_path).schema_arrow
+    metadata = schema.metadata or {}
+    if b"pandas" not in metadata:
+        # Project a single column: only the container type matters here
+        if cache_path.suffix == ".feather":
+            obj = pd.read_feather(cache_path, columns=schema.names[:1])
+        else:
+            obj = pd.read_parquet(cache_path, columns=schema.names[:1])
+        return "Series" if isinstance(obj, pd.Series) else "DataFrame"
+
+    pandas_meta = json.loads(metadata[b"pandas"])
+    return "Series" if pandas_meta.get("pandas_type") == "series" else "DataFrame"
+
+
+def write_meta(cache_path: Path, overwrite: bool = False) -> None:
+    """Create or update the metadata file adjacent to *cache_path*."""
+    meta_path = cache_path.with_suffix(".meta.json")
     if meta_path.exists() and not overwrite:
         logging.debug("Meta exists, skipping: %s", meta_path)
         return
 
-    # Load just enough to infer pandas type
-    obj = pd.read_parquet(pq_path)
-    pandas_type = "Series" if isinstance(obj, pd.Series) else "DataFrame"
-
     meta = {
-        "pandas_type": pandas_type,
+        "pandas_type": infer_pandas_type(cache_path),
         # Use file mtime as best proxy for creation when back-filling
         "created_at": datetime.fromtimestamp(
-            pq_path.stat().st_mtime, tz=timezone.utc
+            cache_path.stat().st_mtime, tz=timezone.utc
         ).isoformat(),
     }
 
-    with open(meta_path, "w") as fp:
-        json.dump(meta, fp, indent=4)
+    # Serialize in memory and write once to a temp file, then rename it into
+    # place so a crash never leaves a half-written .meta.json behind.
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+    tmp_path.write_bytes(json.dumps(meta, indent=4).encode())
+    os.replace(tmp_path, meta_path)
 
-    logging.info("Wrote meta for %s", pq_path.relative_to(pq_path.parent.parent))
+    logging.info("Wrote meta for %s", cache_path.relative_to(cache_path.parent.parent))
+
+
+def _write_meta_logged(cache_path: Path, overwrite: bool) -> None:
+    """Run `write_meta`, logging (not raising) any per-file failure."""
+    try:
+        write_meta(cache_path, overwrite=overwrite)
+    except Exception as exc:
+        logging.error("Failed on %s: %s", cache_path, exc)
 
 
 def backfill(directory: Path, overwrite: bool = False) -> None:
-    """Back-fill metadata for every parquet file under *directory*."""
-    for pq in parquet_files(directory):
-        try:
-            write_meta(pq, overwrite=overwrite)
-        except Exception as exc:
-            logging.error("Failed on %s: %s", pq, exc)
+    """Back-fill metadata for every parquet/feather cache under *directory*.
+
+    Files are independent and the work is I/O-bound, so they are handled by a
+    thread pool.
+    """
+    files = list(cache_files(directory))
+    if not files:
+        return
+
+    max_workers = min(32, (os.cpu_count() or 4) * 4, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(lambda p: _write_meta_logged(p, overwrite), files))
 
 
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments."""
     parser = argparse.ArgumentParser(
-        description="Back-fill .meta.json files for cached Parquet files."
+        description="Back-fill .meta.json files for cached Parquet/Feather files."
     )
     parser.add_argument(
         "cache_directory",
         nargs="?",
         default=DATA_DIR,
         type=Path,
-        help=f"Root directory containing cache parquet files (default: {DATA_DIR})",
+        help=f"Root directory containing cache parquet/feather files (default: {DATA_DIR})",
     )
     parser.add_argument(
         "--overwrite",
@@ -3,11 +3,19 @@
 Quick trend printer for quality_scoreboard.md
 """
 
-import pathlib
+import pandas as pd
 
-md = pathlib.Path("prompts/quality_scoreboard.md").read_text().splitlines()
-rows = [line for line in md if line.startswith("| 20")]
-print(
-    f"Rows: {len(rows)}  Mean scores:",
-    [float(line.split("|")[3]) for line in rows[-5:]],
+# Parse the markdown table in one C-engine pass; "#" skips the title line so
+# the header row fixes the column count. Field 1 is the timestamp, 3 the mean.
+df = pd.read_csv(
+    "prompts/quality_scoreboard.md",
+    sep="|",
+    engine="c",
+    header=None,
+    comment="#",
+    skipinitialspace=True,
+    dtype=str,
 )
+df = df[df[1].str.startswith("20", na=False)]
+means = df[3].iloc[-5:].astype(float).to_numpy()
+print(f"Rows: {len(df)}  Mean scores:", means.tolist())
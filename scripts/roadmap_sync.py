@@ -17,42 +17,81 @@ import datetime
 import json
 import pathlib
 import re
+import sys
+from collections.abc import Iterable, Iterator
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:  # make `import src...` work from scripts/
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.json_compat import loads  # noqa: E402
+
 PROMPTS = ROOT / "prompts"
 ROADMAP = PROMPTS / "roadmap.jsonl"
 STARTER = PROMPTS / "starter_prompt.txt"
 
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+_TICKET_BLOCK_RE = re.compile(r"## ❸.*", re.DOTALL)  # §5 block runs to EOF
+
+
+def branch_slug(title: str) -> str:
+    return _SLUG_RE.sub("-", title.lower())[:20].strip("-")
+
+
+def iter_roadmap() -> Iterator[dict]:
+    """Yield roadmap tasks one line at a time."""
+    with ROADMAP.open("r", encoding="utf8") as fp:
+        for line in fp:
+            if line.strip():
+                yield loads(line)
 
-def load_roadmap():
-    return [
-        json.loads(line) for line in ROADMAP.read_text().splitlines() if line.strip()
-    ]
 
+def load_roadmap() -> list[dict]:
+    return list(iter_roadmap())
 
-def find_active(tasks):
-    inprog = [t for t in tasks if t["Status"] == "IN PROGRESS"]
-    if inprog:
-        return inprog[0], False
-    # first actionable NOT STARTED (skip Type==Section)
+
+def _recording(tasks: Iterable[dict], seen: list[dict]) -> Iterator[dict]:
+    """Yield *tasks*, appending each one to *seen* as it is consumed."""
     for t in tasks:
-        if t["Status"] == "NOT STARTED" and t["Type"] != "Section":
-            return t, True
+        seen.append(t)
+        yield t
+
+
+def find_active(tasks: Iterable[dict]):
+    """Return ``(index, task, need_rollover)`` for the active ticket.
+
+    Accepts any iterable and stops at the first IN PROGRESS task, so with
+    ``iter_roadmap()`` the rest of the file is never parsed.
+    """
+    first_todo = None
+    for i, t in enumerate(tasks):
+        if t["Status"] == "IN PROGRESS":
+            return i, t, False
+        # first actionable NOT STARTED (skip Type==Section)
+        if (
+            first_todo is None
+            and t["Status"] == "NOT STARTED"
+            and t["Type"] != "Section"
+        ):
+            first_todo = i, t
+    if first_todo is not None:
+        return (*first_todo, True)
     raise RuntimeError("No actionable task found")
 
 
-def rewrite_files(completed_id: str | None, next_task: dict):
+def rewrite_files(tasks: list[dict], completed_id: str | None, next_task: dict):
+    """Apply the rollover to the already-loaded *tasks* (in place) and save."""
     today = datetime.date.today().isoformat()
-    lines = []
-    for t in load_roadmap():
+    for t in tasks:
         if completed_id and t["ID"] == completed_id:
             t["Status"], t["Completion_Date"] = "DONE", today
         if t["ID"] == next_task["ID"]:
             t["Status"] = "IN PROGRESS"
             if t["Start_Date"] in ("N/A", ""):
                 t["Start_Date"] = today
-        lines.append(json.dumps(t))
-    ROADMAP.write_text("\n".join(lines))
+    # Stdlib defaults match the tracked file's format (", "/": " separators,
+    # ASCII escapes), so a rollover only diffs the lines it changes
+    ROADMAP.write_text("\n".join(json.dumps(t) for t in tasks), encoding="utf8")
 
     # update starter_prompt.txt §5 block
     txt = STARTER.read_text()
@@ -61,26 +100,27 @@ def rewrite_files(completed_id: str | None, next_task: dict):
         f"> *This block is rewritten automatically by `scripts/roadmap_sync.py`.*\n\n"
         f"**Ticket ID:** `{next_task['ID']}` — *{next_task['Task_Title']}*\n"
         f"**Branch:** `feature/{next_task['ID']}-"
-        f"{re.sub(r'[^a-z0-9-]+', '-', next_task['Task_Title'].lower())[:20].strip('-')}`"
+        f"{branch_slug(next_task['Task_Title'])}`"
         f"`\n\n"
         f"### Tasks\n• TBD by agent\n"
     )
-    STARTER.write_text(re.sub(r"## ❸[\s\S]*", new_block, txt))
+    STARTER.write_text(_TICKET_BLOCK_RE.sub(new_block, txt))
 
 
 def main():
-    tasks = load_roadmap()
-    active, need_rollover = find_active(tasks)
+    # A rollover is only reported after find_active has consumed the whole
+    # file, so the tasks it parsed on the way are all the rewrite needs
+    tasks: list[dict] = []
+    idx, active, need_rollover = find_active(_recording(iter_roadmap(), tasks))
     if need_rollover:
         # assume previous ticket is last DONE before this index
-        idx = tasks.index(active)
-        completed = next((t for t in tasks[:idx][::-1] if t["Status"] == "DONE"), None)
-        rewrite_files(completed["ID"] if completed else None, active)
+        completed = next(
+            (t for t in reversed(tasks[:idx]) if t["Status"] == "DONE"), None
+        )
+        rewrite_files(tasks, completed["ID"] if completed else None, active)
     summary = {
         "active_ticket": active["ID"],
-        "branch_slug": re.sub(r"[^a-z0-9-]+", "-", active["Task_Title"].lower())[
-            :20
-        ].strip("-"),
+        "branch_slug": branch_slug(active["Task_Title"]),
         "need_rollover": need_rollover,
     }
     print(json.dumps(summary))
@@ -2,10 +2,14 @@
 
 Loads settings from environment variables and/or a .env file.
 Provides type-hinted access to configuration values like API keys and paths.
+
+Settings are built on first use by ``get_settings()`` rather than at import,
+so importing a module that depends on config stays cheap.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,4 +32,14 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, creating it on first call."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # Backwards-compatible ``from src.config import settings`` (resolved lazily)
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
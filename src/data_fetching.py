@@ -5,185 +5,274 @@ Handles fetching data from:
 - CoinMetrics Community API for various on-chain metrics.
 
 Includes robust error handling, request retries (via session),
-and disk caching to avoid redundant downloads.
+single-request Yahoo history (with concurrent yearly chunks as the
+fallback), and disk caching to avoid redundant downloads.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
-import random
-import time
-from datetime import datetime, timedelta, timezone
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 import requests
 
 # Import settings and helpers
-from src.config import settings
+from src.config import get_settings
 
 from .utils import disk_cache, robust_get  # Remove DATA_DIR import
 
 # --- Data Fetching Functions ---
 
+# Yahoo chart requests are independent per 365-day window, so they are issued
+# concurrently; the pool size bounds how many are in flight against RapidAPI.
+_YF_MAX_WORKERS = 8
+# CoinMetrics' community tier shares one quota per client, keep this small.
+_CM_MAX_WORKERS = 4
 
-# Note: The disk_cache decorator needs to be aware of settings.DATA_DIR
-# We assume the implementation of disk_cache uses settings.DATA_DIR
-# For simplicity, the cache filename passed here remains relative
-@disk_cache("eth_price_yf.parquet", max_age_hr=24)
-def fetch_eth_price_rapidapi() -> pd.DataFrame:
-    """Fetches daily ETH-USD close from Yahoo via RapidAPI (chunked).
+# UTC midnight of a date as epoch seconds is plain day arithmetic
+_EPOCH = date(1970, 1, 1)
+_DAY = 86400
 
-    Uses disk caching defined in utils.py (assumed to use settings.DATA_DIR).
+# Yahoo chunks that ended this long ago no longer change; each is cached on
+# its own so a refresh only re-requests the most recent window(s).
+_YF_SETTLED_DAYS = 7
+# A single-span response must reach this close to both edges of a window for
+# that window to be cached from it; market closures never exceed about a week.
+_YF_EDGE_SLACK = 7 * _DAY
+_YF_CHUNK_DIRNAME = "yf_chunks"
 
-    Returns:
-        pd.DataFrame: A DataFrame with a single 'price_usd' column and DatetimeIndex.
-                      Returns an empty DataFrame if fetching fails completely.
-    """
-    key = settings.RAPIDAPI_KEY
-    if not key:
-        logging.error("RAPIDAPI_KEY not found in settings.")
-        raise ValueError("RAPIDAPI_KEY not configured in settings")
 
-    host = "apidojo-yahoo-finance-v1.p.rapidapi.com"
-    url = f"https://{host}/stock/v2/get-chart"
-    hdrs = {"X-RapidAPI-Key": key, "X-RapidAPI-Host": host}
-
-    # YF API reported firstTradeDate around here for ETH-USD
-    start = datetime(2017, 11, 9).date()
-    today = datetime.now(tz=timezone.utc).date()
-    pieces: list[pd.Series] = []  # Type hint for list of Series
-    logging.info("Starting Yahoo Finance ETH price fetch from %s to %s", start, today)
+def _yf_chunk_params(
+    symbol: str, tag: str, start: date, today: date
+) -> list[tuple[date, date, dict[str, Any], str]]:
+    """Splits ``start``..``today`` into the 365-day windows requested from Yahoo.
 
+    Returns:
+        list: ``(chunk_start, chunk_end, params, prefix)`` for every window;
+              ``period2`` is the exclusive midnight (UTC) after ``chunk_end``
+              and ``prefix`` names the chunk's snapshot and cache files.
+    """
+    chunks: list[tuple[date, date, dict[str, Any], str]] = []
     while start <= today:
         end = min(start + timedelta(days=364), today)
-        try:
-            start_ts = int(
-                datetime.combine(
-                    start, datetime.min.time(), tzinfo=timezone.utc
-                ).timestamp()
-            )
-            end_ts = int(
-                datetime.combine(
-                    end + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
-                ).timestamp()
-            )
-        except (OverflowError, OSError) as ts_err:
-            logging.error(
-                f"Timestamp conversion error for dates {start} to {end}: {ts_err}. Skipping chunk."
-            )
-            start = end + timedelta(days=1)
-            continue
-
         params = {
-            "symbol": "ETH-USD",
+            "symbol": symbol,
             "interval": "1d",
-            "period1": start_ts,
-            "period2": end_ts,
+            "period1": (start - _EPOCH).days * _DAY,
+            "period2": (end - _EPOCH).days * _DAY + _DAY,
         }
-        logging.debug(f"Fetching YF ETH: start={start}, end={end}, params={params}")
-        response_json = None
-        try:
-            # Use robust_get imported from utils
-            prefix = f"yf_eth_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}"
-            # robust_get returns dict[str, Any], which is compatible with Json type alias
-            response_json = robust_get(
-                url, headers=hdrs, params=params, snapshot_prefix=prefix
-            )
+        chunks.append((start, end, params, f"{tag}_{start:%Y%m%d}_{end:%Y%m%d}"))
+        start = end + timedelta(days=1)
+    return chunks
+
+
+def _yf_chunk_path(prefix: str, end: date, today: date) -> Path | None:
+    """Cache file for a settled chunk, or ``None`` while Yahoo may still revise it."""
+    if end >= today - timedelta(days=_YF_SETTLED_DAYS):
+        return None
+    return get_settings().DATA_DIR / _YF_CHUNK_DIRNAME / f"{prefix}.parquet"
+
+
+def _load_yf_chunks(
+    chunks: list[tuple[date, date, dict[str, Any], str]],
+    today: date,
+    pieces: list[tuple[np.ndarray, np.ndarray]],
+) -> list[tuple[date, date, dict[str, Any], str]]:
+    """Appends cached settled chunks to ``pieces`` and returns the ones to fetch."""
+    pending = []
+    for chunk in chunks:
+        _start, end, _params, prefix = chunk
+        path = _yf_chunk_path(prefix, end, today)
+        if path is not None and path.exists():
+            try:
+                df = pd.read_parquet(path)
+                if len(df):  # settled windows with no trading are cached empty
+                    pieces.append((df["ts"].to_numpy(), df["px"].to_numpy()))
+                continue
+            except Exception as e:
+                logging.warning(f"Failed to load chunk cache {path}: {e}. Re-fetching.")
+        pending.append(chunk)
+    logging.info(
+        "%d of %d Yahoo chunks loaded from cache.",
+        len(chunks) - len(pending),
+        len(chunks),
+    )
+    return pending
 
-            # Defensive parsing checks (ensure structure is as expected)
-            chart_data = response_json.get("chart", {})
-            chart_result = chart_data.get("result")
-            chart_error = chart_data.get("error")
 
-            if chart_error or chart_result is None:
-                error_desc = (
-                    chart_error.get("description", "Result is null")
-                    if chart_error
-                    else "Result is null"
-                )
-                if "Data doesn't exist" in error_desc or "No data found" in error_desc:
-                    logging.info(
-                        f"YF ETH API reported no data for {start} to {end}: {error_desc}"
-                    )
-                else:
-                    logging.error(
-                        f"YF ETH API Error for {start} to {end}: {error_desc}"
-                    )
-                start = end + timedelta(days=1)
-                continue
+def _save_yf_chunk(
+    prefix: str, end: date, today: date, ts: np.ndarray, px: np.ndarray
+) -> None:
+    """Caches a settled chunk's arrays; later runs skip its request."""
+    path = _yf_chunk_path(prefix, end, today)
+    if path is None:
+        return
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({"ts": ts, "px": px}).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.error(f"Failed to save chunk cache {path}: {e}")
 
-            if not isinstance(chart_result, list) or not chart_result:
-                logging.warning(
-                    f"YF ETH API 'result' is not a non-empty list for {start} to {end}. Skipping. Result: {str(chart_result)[:200]}..."
-                )
-                start = end + timedelta(days=1)
-                continue
 
-            result_data = chart_result[0]
-            timestamps = result_data.get("timestamp")
-            indicators = result_data.get("indicators")
+def _drop_pre_listing_chunks(
+    url: str,
+    hdrs: dict[str, str],
+    chunks: list[tuple[date, date, dict[str, Any], str]],
+    start: date,
+) -> list[tuple[date, date, dict[str, Any], str]]:
+    """Drops windows that end before the symbol's first trade on Yahoo.
 
-            if timestamps is None or indicators is None:
-                logging.warning(
-                    f"Missing 'timestamp' or 'indicators' in YF ETH API result[0] for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    The hardcoded start dates are conservative, so the earliest windows can
+    come back as "Data doesn't exist". One tiny probe for
+    ``meta.firstTradeDate`` avoids those requests. The chunk grid itself
+    stays anchored at ``start`` so cached chunk names remain stable.
+    """
+    if not chunks or chunks[0][0] != start:
+        return chunks  # the early windows are cached already
+    symbol = chunks[0][2]["symbol"]
+    try:
+        probe = robust_get(
+            url,
+            headers=hdrs,
+            params={"symbol": symbol, "interval": "1d", "range": "5d"},
+            snapshot_prefix=f"yf_probe_{symbol}",
+        )
+        first_ts = int(probe["chart"]["result"][0]["meta"]["firstTradeDate"])
+    except Exception as e:
+        logging.debug(f"No firstTradeDate for {symbol} ({e}); fetching all chunks.")
+        return chunks
+    first_trade = _EPOCH + timedelta(days=first_ts // _DAY)
+    kept = [chunk for chunk in chunks if chunk[1] >= first_trade]
+    logging.info(
+        "%s first traded on %s; skipping %d earlier chunk(s).",
+        symbol,
+        first_trade,
+        len(chunks) - len(kept),
+    )
+    return kept
 
-            quote = indicators.get("quote")
-            if not quote or not isinstance(quote, list) or not quote[0]:
-                logging.warning(
-                    f"Missing 'quote' array in YF ETH API indicators for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
 
-            close_prices = quote[0].get("close")
-            if close_prices is None:
-                logging.warning(
-                    f"Missing 'close' prices in YF ETH API quote[0] for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+def _yf_get(
+    yf_get: Callable[..., dict[str, Any]], params: dict[str, Any], prefix: str
+) -> dict[str, Any]:
+    """Runs one Yahoo chart request on a worker thread.
 
-            if not isinstance(timestamps, list) or not isinstance(close_prices, list):
-                logging.warning(
-                    f"Timestamps or close_prices are not lists for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    ``yf_get`` is robust_get with the chart URL and headers already bound.
+    Pacing is left to robust_get's per-host token bucket, which is shared by
+    every worker, so no per-request sleep is needed here.
+    """
+    logging.debug(f"Fetching YF {params['symbol']}: params={params}")
+    return yf_get(params=params, snapshot_prefix=prefix)
 
-            if len(close_prices) != len(timestamps):
-                logging.warning(
-                    f"Mismatch length for close/timestamps in YF ETH API response for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
 
-            # Create Series, ensuring index matches non-null data points
-            valid_indices = [
-                i for i, price in enumerate(close_prices) if price is not None
-            ]
-            if not valid_indices:
-                logging.info(
-                    f"No valid (non-null) ETH price data found for chunk {start} to {end}."
-                )
-            else:
-                valid_timestamps = [timestamps[i] for i in valid_indices]
-                valid_prices = [close_prices[i] for i in valid_indices]
-
-                series_data = pd.Series(
-                    valid_prices,
-                    index=pd.to_datetime(valid_timestamps, unit="s", utc=True)
-                    .tz_convert(None)
-                    .normalize(),
-                    name="price_usd",
-                )
-                pieces.append(series_data)
-                logging.debug(
-                    f"Successfully processed YF ETH chunk {start} to {end}, got {len(series_data)} data points."
-                )
+def _parse_yf_chart(
+    response_json: dict[str, Any], label: str, span: str
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Validates one Yahoo chart response and extracts its non-null closes.
+
+    Args:
+        response_json (dict): Decoded chart response.
+        label (str): Symbol label used in log messages (e.g. 'ETH').
+        span (str): The requested window, for log messages.
+
+    Returns:
+        tuple | None: ``(epoch_seconds, close)`` arrays, or None if the
+                      response holds no usable prices (the reason is logged).
+    """
+    # Defensive parsing checks (ensure structure is as expected)
+    chart_data = response_json.get("chart", {})
+    chart_result = chart_data.get("result")
+    chart_error = chart_data.get("error")
+
+    if chart_error or chart_result is None:
+        error_desc = (
+            chart_error.get("description", "Result is null")
+            if chart_error
+            else "Result is null"
+        )
+        if "Data doesn't exist" in error_desc or "No data found" in error_desc:
+            logging.info(f"YF {label} API reported no data for {span}: {error_desc}")
+        else:
+            logging.error(f"YF {label} API Error for {span}: {error_desc}")
+        return None
+
+    # One strict lookup instead of a .get()/isinstance chain per level
+    try:
+        result_data = chart_result[0]
+        timestamps = result_data["timestamp"]
+        close_prices = result_data["indicators"]["quote"][0]["close"]
+    except (KeyError, IndexError, TypeError) as e:
+        logging.warning(
+            f"Malformed YF {label} API response for {span} "
+            f"({type(e).__name__}: {e}). Skipping. Result: {str(chart_result)[:200]}..."
+        )
+        return None
+
+    if not isinstance(timestamps, list) or not isinstance(close_prices, list):
+        logging.warning(
+            f"Timestamps or close_prices are not lists for {span}. Skipping."
+        )
+        return None
+
+    if len(close_prices) != len(timestamps):
+        logging.warning(
+            f"Mismatch length for close/timestamps in YF {label} API response for {span}. Skipping."
+        )
+        return None
+
+    # JSON nulls become NaN in the float array and are masked out
+    px_arr = np.array(close_prices, dtype=np.float64)
+    valid = ~np.isnan(px_arr)
+    if not valid.any():
+        logging.info(f"No valid (non-null) {label} price data found for {span}.")
+        return None
+    ts_arr = np.array(timestamps, dtype=np.int64)[valid]
+    logging.debug(
+        f"Successfully processed YF {label} chunk {span}, got {len(ts_arr)} data points."
+    )
+    return ts_arr, px_arr[valid]
+
+
+def _fetch_yf_chunks(
+    url: str,
+    hdrs: dict[str, str],
+    chunks: list[tuple[date, date, dict[str, Any], str]],
+    today: date,
+    label: str,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Requests ``chunks`` concurrently and parses each Yahoo chart response.
+
+    Returns:
+        list: ``(epoch_seconds, close)`` arrays for every window that
+              parsed; failed or empty windows are logged and skipped.
+    """
+    pieces: list[tuple[np.ndarray, np.ndarray]] = []
+    yf_get = functools.partial(robust_get, url, headers=hdrs)
+    with ThreadPoolExecutor(max_workers=_YF_MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(_yf_get, yf_get, params, prefix)
+            for _s, _e, params, prefix in chunks
+        ]
+
+    for (start, end, _params, prefix), future in zip(chunks, futures):
+        try:
+            # Re-raises whatever the worker's robust_get call raised
+            response_json = future.result()
+
+            parsed = _parse_yf_chart(response_json, label, f"{start} to {end}")
+            if parsed is not None:
+                pieces.append(parsed)
+                _save_yf_chunk(prefix, end, today, *parsed)
 
         except (
             RuntimeError,
@@ -193,96 +282,206 @@ def fetch_eth_price_rapidapi() -> pd.DataFrame:
         ) as req_err:
             # Errors from robust_get or parsing issues already logged by robust_get or above checks
             logging.error(
-                f"Handled error during YF ETH fetch/parse for chunk {start} to {end}: {req_err}. Skipping chunk."
+                f"Handled error during YF {label} fetch/parse for chunk {start} to {end}: {req_err}. Skipping chunk."
             )
         except Exception as e:
             logging.error(
-                f"Unexpected error processing YF ETH chunk {start} to {end}: {e}",
+                f"Unexpected error processing YF {label} chunk {start} to {end}: {e}",
                 exc_info=True,
             )
-        finally:
-            # Ensure 'start' is always incremented
-            start = end + timedelta(days=1)
-            # Add a small delay to avoid hitting rate limits
-            time.sleep(random.uniform(0.2, 0.5))  # nosec B311
+
+    return pieces
+
+
+def _fetch_yf_history(
+    url: str,
+    hdrs: dict[str, str],
+    chunks: list[tuple[date, date, dict[str, Any], str]],
+    today: date,
+    label: str,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Fetches the uncached windows, in a single request when Yahoo allows it.
+
+    One request spanning ``chunks[0]`` to ``chunks[-1]`` replaces one per
+    window. If it fails, or Yahoo answers with a coarser-than-daily
+    (truncated) series, the per-window requests are made instead. Windows
+    the span response does not reach into at both edges (e.g. a series that
+    starts late) are requested on their own rather than cached from it.
+    """
+    if len(chunks) > 1:
+        first, last = chunks[0], chunks[-1]
+        span = (
+            first[0],
+            last[1],
+            {**first[2], "period2": last[2]["period2"]},
+            f"{first[3].rsplit('_', 1)[0]}_{last[1]:%Y%m%d}",
+        )
+        pieces = _fetch_yf_chunks(url, hdrs, [span], today, label)
+        if pieces:
+            ts, px = pieces[0]
+            if len(ts) < 2 or np.median(np.diff(ts)) <= 2 * _DAY:
+                # Settled windows are cached from the slice they cover, but
+                # only if the response actually spans the whole window
+                uncovered = []
+                for chunk in chunks:
+                    _start, end, params, prefix = chunk
+                    in_window = (ts >= params["period1"]) & (ts < params["period2"])
+                    ts_w = ts[in_window]
+                    if (
+                        len(ts_w)
+                        and ts_w[0] - params["period1"] <= _YF_EDGE_SLACK
+                        and params["period2"] - ts_w[-1] <= _YF_EDGE_SLACK
+                    ):
+                        _save_yf_chunk(prefix, end, today, ts_w, px[in_window])
+                    else:
+                        uncovered.append(chunk)
+                if uncovered:
+                    logging.info(
+                        f"Single YF {label} request did not cover {len(uncovered)} "
+                        "window(s); requesting them separately."
+                    )
+                    pieces += _fetch_yf_chunks(url, hdrs, uncovered, today, label)
+                return pieces
+        logging.warning(
+            f"Single YF {label} request for {first[0]} to {last[1]} was unusable; "
+            f"falling back to {len(chunks)} chunked requests."
+        )
+    return _fetch_yf_chunks(url, hdrs, chunks, today, label)
+
+
+def _daily_series(pieces: list[tuple[np.ndarray, np.ndarray]], name: str) -> pd.Series:
+    """Joins per-chunk ``(epoch_seconds, price)`` arrays into one daily Series.
+
+    Timestamps are floored to UTC midnight, stably sorted and de-duplicated
+    (first chunk wins) on the raw int64 values, so the DatetimeIndex is
+    built once at the end rather than per chunk.
+    """
+    ts = np.concatenate([p[0] for p in pieces])
+    px = np.concatenate([p[1] for p in pieces])
+    ts -= ts % _DAY
+    order = np.argsort(ts, kind="stable")
+    ts, px = ts[order], px[order]
+    keep = np.ones(len(ts), dtype=bool)
+    np.not_equal(ts[1:], ts[:-1], out=keep[1:])
+    # unit="s" without utc=True yields the tz-naive UTC index the cache expects
+    return pd.Series(px[keep], index=pd.to_datetime(ts[keep], unit="s"), name=name)
+
+
+def _yf_daily_fetch(symbol: str, tag: str, start: date, name: str) -> pd.Series:
+    """Fetches the daily Yahoo close for ``symbol`` from ``start`` to today.
+
+    Shared by the ETH and NASDAQ fetchers: settled windows come from the
+    per-chunk cache, windows before the symbol's first trade are dropped,
+    and the rest is requested via _fetch_yf_history.
+
+    Args:
+        symbol (str): Yahoo ticker (e.g. 'ETH-USD', '^NDX').
+        tag (str): Prefix for snapshot and per-chunk cache names.
+        start (date): First day of the history; anchors the window grid.
+        name (str): Name of the returned Series.
+
+    Returns:
+        pd.Series: Daily closes with DatetimeIndex, or an empty float
+                   Series named ``name`` if nothing was collected.
+
+    Raises:
+        ValueError: If RAPIDAPI_KEY is not configured.
+    """
+    key = get_settings().RAPIDAPI_KEY
+    if not key:
+        logging.error("RAPIDAPI_KEY not found in settings.")
+        raise ValueError("RAPIDAPI_KEY not configured in settings")
+
+    host = "apidojo-yahoo-finance-v1.p.rapidapi.com"
+    url = f"https://{host}/stock/v2/get-chart"
+    hdrs = {"X-RapidAPI-Key": key, "X-RapidAPI-Host": host}
+
+    today = datetime.now(tz=timezone.utc).date()
+    pieces: list[tuple[np.ndarray, np.ndarray]] = []  # (epoch_s, price) per chunk
+    logging.info("Starting Yahoo Finance %s fetch from %s to %s", symbol, start, today)
+
+    chunks = _yf_chunk_params(symbol, tag, start, today)
+    chunks = _load_yf_chunks(chunks, today, pieces)
+    chunks = _drop_pre_listing_chunks(url, hdrs, chunks, start)
+    pieces.extend(_fetch_yf_history(url, hdrs, chunks, today, symbol))
 
     if not pieces:
-        logging.error("No ETH price data pieces were collected from Yahoo Finance API.")
-        # Return an empty DataFrame with the correct structure if no data is fetched
-        return pd.DataFrame(columns=["price_usd"], index=pd.to_datetime([]))
-        # Or raise: raise RuntimeError("No ETH data successfully fetched from Yahoo Finance API.")
+        logging.error(f"No {symbol} data pieces were collected from Yahoo Finance API.")
+        return pd.Series(dtype=float, index=pd.to_datetime([]), name=name)
 
     logging.info(
-        "Finished Yahoo Finance ETH fetch. Concatenating %d pieces.", len(pieces)
+        "Finished Yahoo Finance %s fetch. Concatenating %d pieces.", symbol, len(pieces)
     )
-    eth_df = (
-        pd.concat(pieces).sort_index().loc[lambda s: ~s.index.duplicated()]
-    )  # De-duplicate just in case
+    return _daily_series(pieces, name)
 
-    # Ensure final result index is timezone-naive (should be handled by disk_cache too)
-    if (
-        pd.api.types.is_datetime64_any_dtype(eth_df.index)
-        and eth_df.index.tz is not None
-    ):
-        eth_df.index = eth_df.index.tz_localize(None)
 
-    # Ensure cache path is correct in the disk_cache decorator logic
-    # Example: The decorator should internally use settings.DATA_DIR / cache_filename
-    # Here, we return the DataFrame. The decorator handles saving to settings.DATA_DIR / "eth_price_yf.parquet"
-    return eth_df.to_frame()  # Ensure return is DataFrame
+# Note: The disk_cache decorator needs to be aware of settings.DATA_DIR
+# We assume the implementation of disk_cache uses settings.DATA_DIR
+# For simplicity, the cache filename passed here remains relative
+@disk_cache("eth_price_yf.feather", max_age_hr=24)
+def fetch_eth_price_rapidapi() -> pd.DataFrame:
+    """Fetches daily ETH-USD close from Yahoo via RapidAPI (chunked).
 
+    Uses disk caching defined in utils.py (assumed to use settings.DATA_DIR).
 
-@disk_cache(
-    "cm_{asset}_{metric}.parquet", max_age_hr=24
-)  # Dynamic name passed to decorator
-def cm_fetch(
-    metric: str, asset: str = "eth", start: str = "2015-08-01", freq: str = "1d"
-) -> pd.Series:
-    """Fetches a specific metric from CoinMetrics Community API.
+    Returns:
+        pd.DataFrame: A DataFrame with a single 'price_usd' column and DatetimeIndex.
+                      Returns an empty DataFrame if fetching fails completely.
+    """
+    # YF API reported firstTradeDate around here for ETH-USD
+    start = date(2017, 11, 9)
+    return _yf_daily_fetch("ETH-USD", "yf_eth", start, "price_usd").to_frame()
 
-    Uses disk caching defined in utils.py (assumed to use settings.DATA_DIR).
-    Cache filename includes asset and metric dynamically handled by the decorator.
 
-    Args:
-        metric (str): The CoinMetrics metric ID (e.g., 'AdrActCnt').
-        asset (str): The asset ID (default: 'eth').
-        start (str): Start date in 'YYYY-MM-DD' format (default: '2015-08-01').
-        freq (str): Data frequency ('1d', '1h', etc.) (default: '1d').
+def _cm_paginate(metrics: list[str], asset: str, start: str, freq: str) -> pd.DataFrame:
+    """Pages through one CoinMetrics request for ``metrics`` (comma-joined).
+
+    Every record is read once for all requested metrics, so N metrics cost
+    one pagination instead of N.
 
     Returns:
-        pd.Series: A Series containing the metric data with DatetimeIndex.
-                   Returns an empty Series if fetching fails.
+        pd.DataFrame: One float64 column per metric on a sorted, de-duplicated
+                      'time' DatetimeIndex. Empty if fetching fails or the
+                      first record lacks 'time' or any requested metric.
     """
-    # The cache filename is handled dynamically by the decorator based on args.
-    # The decorator should construct the full path using settings.DATA_DIR.
-
+    label = ",".join(metrics)
+    empty = pd.DataFrame(
+        np.empty((0, len(metrics))),
+        index=pd.DatetimeIndex([], name="time"),
+        columns=metrics,
+    )
     base = (
         f"https://community-api.coinmetrics.io/v4/timeseries/asset-metrics"
-        f"?assets={asset}&metrics={metric}&frequency={freq}"
+        f"?assets={asset}&metrics={label}&frequency={freq}"
         f"&start_time={start}&page_size=10000"
     )
     hdr: dict[str, str] = {}  # Type hint for header dict
-    api_key = settings.CM_API_KEY  # Use settings
+    api_key = get_settings().CM_API_KEY  # Use settings
     if api_key:
         hdr["Authorization"] = f"Bearer {api_key}"
-        logging.info(f"Using CoinMetrics API Key for metric: {metric}")
+        logging.info(f"Using CoinMetrics API Key for metrics: {label}")
     else:
-        logging.info(f"Fetching CoinMetrics data without API key for metric: {metric}")
-
-    data: list[dict[str, str]] = []  # Type hint for list of dicts
+        logging.info(f"Fetching CoinMetrics data without API key for metrics: {label}")
+
+    # Each page is reduced to int64 epoch-ns and float64 arrays as it arrives,
+    # so neither the record dicts nor their time/value strings outlive it
+    ts_chunks: list[np.ndarray] = []
+    val_chunks: list[np.ndarray] = []
+    n_records = 0
+    first_record: dict[str, Any] | None = None  # schema check below
     url: str | None = base  # Type hint for url (can be None)
     page_count = 0
+    cm_get = functools.partial(robust_get, headers=hdr)
     while url:
         page_count += 1
         logging.debug(f"Fetching CM page {page_count}: {url.split('?')[0]}...")
         try:
-            # Use robust_get imported from utils
-            prefix = f"cm_{asset}_{metric}_p{page_count}"
-            j = robust_get(url, headers=hdr, snapshot_prefix=prefix)
+            prefix = f"cm_{asset}_{'-'.join(metrics)}_p{page_count}"
+            j = cm_get(url, snapshot_prefix=prefix)
             page_data = j.get("data", [])
             if not isinstance(page_data, list):
                 logging.warning(
-                    f"CM API 'data' field is not a list on page {page_count} for {metric}. Skipping page."
+                    f"CM API 'data' field is not a list on page {page_count} for {label}. Skipping page."
                 )
                 url = j.get("next_page_url")  # Still try next page
                 continue
@@ -290,16 +489,29 @@ def cm_fetch(
             # Basic check: Ensure items in page_data are dictionaries
             if page_data and not all(isinstance(item, dict) for item in page_data):
                 logging.warning(
-                    f"CM API 'data' items are not all dictionaries on page {page_count} for {metric}. Skipping page."
+                    f"CM API 'data' items are not all dictionaries on page {page_count} for {label}. Skipping page."
                 )
                 url = j.get("next_page_url")  # Still try next page
                 continue
 
-            data.extend(page_data)  # Now safe to extend
+            # Now safe to read the records
+            if first_record is None and page_data:
+                first_record = page_data[0]
+            # Missing values become NaT/NaN
+            ts_chunks.append(
+                pd.to_datetime([rec.get("time") for rec in page_data], utc=True)
+                .tz_convert(None)
+                .asi8
+            )
+            val_chunks.append(
+                np.array(
+                    [[rec.get(m) for m in metrics] for rec in page_data],
+                    dtype=np.float64,
+                ).reshape(len(page_data), len(metrics))
+            )
+            n_records += len(page_data)
+            # Pacing between pages is left to robust_get's per-host rate limiter
             url = j.get("next_page_url")
-            # Add a small delay to be polite to the API
-            if url:
-                time.sleep(random.uniform(0.5, 1.5))  # nosec B311
         except (
             RuntimeError,
             requests.exceptions.RequestException,
@@ -307,252 +519,181 @@ def cm_fetch(
             ValueError,  # Catch potential ValueError from robust_get
         ) as req_err:
             logging.error(
-                f"Failed to fetch or parse CM page for {metric}: {req_err}. Stopping fetch."
+                f"Failed to fetch or parse CM page for {label}: {req_err}. Stopping fetch."
             )
             url = None  # Stop pagination on error
         except Exception as e:
             logging.error(
-                f"Unexpected error fetching CM page for {metric}: {e}", exc_info=True
+                f"Unexpected error fetching CM page for {label}: {e}", exc_info=True
             )
             url = None  # Stop pagination
 
-    if not data:
-        logging.error(f"No data returned from CoinMetrics for metric: {metric}")
-        # Return an empty Series with a datetime index
-        return pd.Series(dtype=float, index=pd.to_datetime([]), name=metric)
-        # Or raise: raise RuntimeError(f"No data returned for {metric}")
+    if not n_records:
+        logging.error(f"No data returned from CoinMetrics for metrics: {label}")
+        return empty
 
-    logging.info(f"Finished CoinMetrics fetch for {metric}, got {len(data)} records.")
+    logging.info(f"Finished CoinMetrics fetch for {label}, got {n_records} records.")
     try:
-        # Ensure 'time' and 'metric' columns exist before processing
-        if not data or "time" not in data[0] or metric not in data[0]:
+        # Ensure 'time' and every metric column exist before processing
+        if first_record is None or not {"time", *metrics} <= first_record.keys():
             logging.error(
-                f"Required columns ('time', '{metric}') not found in first record of CM data."
+                f"Required columns ('time', '{label}') not found in first record of CM data."
             )
-            return pd.Series(dtype=float, index=pd.to_datetime([]), name=metric)
-
-        df_from_data = pd.DataFrame(data)
-        # Check columns again after DataFrame creation
-        if "time" not in df_from_data.columns or metric not in df_from_data.columns:
-            logging.error(
-                f"Required columns ('time', '{metric}') not found in CM DataFrame. Columns: {df_from_data.columns.tolist()}"
-            )
-            return pd.Series(dtype=float, index=pd.to_datetime([]), name=metric)
-
-        series = (
-            df_from_data.assign(time=lambda d: pd.to_datetime(d["time"]))
-            .set_index("time")[metric]
-            .astype(float)  # Convert to float *after* selecting the column
-            .sort_index()
-            .loc[lambda s: ~s.index.duplicated()]
-        )  # De-duplicate just in case
-
-        # Ensure index is timezone-naive (should be handled by disk_cache too)
-        if (
-            pd.api.types.is_datetime64_any_dtype(series.index)
-            and series.index.tz is not None
-        ):
-            series.index = series.index.tz_localize(None)
-        return series
-    except KeyError:
-        logging.error(
-            f"Metric '{metric}' not found in CM response columns after DataFrame creation: {pd.DataFrame(data).columns.tolist()}"
+            return empty
+
+        ts = np.concatenate(ts_chunks)
+        vals = np.concatenate(val_chunks)
+
+        # Sort (stable, first record wins) and de-duplicate on the raw int64 times
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        keep = np.ones(len(ts), dtype=bool)
+        np.not_equal(ts[1:], ts[:-1], out=keep[1:])
+        return pd.DataFrame(
+            vals[order][keep],
+            index=pd.DatetimeIndex(ts[keep].view("datetime64[ns]"), name="time"),
+            columns=metrics,
         )
-        return pd.Series(dtype=float, index=pd.to_datetime([]), name=metric)
     except Exception as e:
         logging.error(
-            f"Error processing CoinMetrics data for {metric}: {e}", exc_info=True
+            f"Error processing CoinMetrics data for {label}: {e}", exc_info=True
         )
-        return pd.Series(dtype=float, index=pd.to_datetime([]), name=metric)
+        return empty
 
 
-@disk_cache("nasdaq_ndx.parquet", max_age_hr=24)
-def fetch_nasdaq() -> pd.Series:
-    """Fetches true-daily ^NDX close from Yahoo via RapidAPI (chunked).
+@disk_cache(
+    "cm_{asset}_{metric}.feather", max_age_hr=24
+)  # Dynamic name passed to decorator
+def cm_fetch(
+    metric: str, asset: str = "eth", start: str = "2015-08-01", freq: str = "1d"
+) -> pd.Series:
+    """Fetches a specific metric from CoinMetrics Community API.
 
     Uses disk caching defined in utils.py (assumed to use settings.DATA_DIR).
+    Cache filename includes asset and metric dynamically handled by the decorator.
+
+    Args:
+        metric (str): The CoinMetrics metric ID (e.g., 'AdrActCnt').
+        asset (str): The asset ID (default: 'eth').
+        start (str): Start date in 'YYYY-MM-DD' format (default: '2015-08-01').
+        freq (str): Data frequency ('1d', '1h', etc.) (default: '1d').
 
     Returns:
-        pd.Series: A pandas Series named 'nasdaq' with DatetimeIndex.
+        pd.Series: A Series containing the metric data with DatetimeIndex.
                    Returns an empty Series if fetching fails.
     """
-    key = settings.RAPIDAPI_KEY  # Use settings
-    if not key:
-        logging.error("RAPIDAPI_KEY not found in settings.")
-        raise ValueError("RAPIDAPI_KEY not configured in settings")
+    return _cm_paginate([metric], asset, start, freq)[metric]
 
-    host = "apidojo-yahoo-finance-v1.p.rapidapi.com"
-    url = f"https://{host}/stock/v2/get-chart"
-    hdrs = {"X-RapidAPI-Key": key, "X-RapidAPI-Host": host}
 
-    start = datetime(1985, 1, 1).date()  # Earliest ^NDX on Yahoo
-    today = datetime.now(tz=timezone.utc).date()
-    pieces: list[pd.Series] = []  # Type hint for list of Series
-    logging.info("Starting NASDAQ (^NDX) fetch from %s to %s", start, today)
+@disk_cache("cm_{asset}_multi_{metrics}.feather", max_age_hr=24)
+def cm_fetch_multi(
+    metrics: list[str],
+    asset: str = "eth",
+    start: str = "2015-08-01",
+    freq: str = "1d",
+) -> pd.DataFrame:
+    """Fetches several CoinMetrics metrics in one paginated request.
 
-    while start <= today:
-        end = min(start + timedelta(days=364), today)
-        try:
-            start_ts = int(
-                datetime.combine(
-                    start, datetime.min.time(), tzinfo=timezone.utc
-                ).timestamp()
-            )
-            end_ts = int(
-                datetime.combine(
-                    end + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
-                ).timestamp()
-            )
-        except (OverflowError, OSError) as ts_err:
-            logging.error(
-                f"Timestamp conversion error for NASDAQ dates {start} to {end}: {ts_err}. Skipping chunk."
-            )
-            start = end + timedelta(days=1)
-            continue
+    The cache filename joins the metric IDs (e.g.
+    'cm_eth_multi_AdrActCnt-TxCnt.feather').
 
-        params = {
-            "symbol": "^NDX",
-            "interval": "1d",
-            "period1": start_ts,
-            "period2": end_ts,
-        }
-        logging.debug(f"Fetching ^NDX: start={start}, end={end}, params={params}")
-        response_json = None
-        try:
-            # Use robust_get imported from utils
-            prefix = f"yf_ndx_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}"
-            response_json = robust_get(
-                url, headers=hdrs, params=params, snapshot_prefix=prefix
-            )
+    Args:
+        metrics (list[str]): CoinMetrics metric IDs (e.g., ['AdrActCnt', 'TxCnt']).
+        asset (str): The asset ID (default: 'eth').
+        start (str): Start date in 'YYYY-MM-DD' format (default: '2015-08-01').
+        freq (str): Data frequency ('1d', '1h', etc.) (default: '1d').
 
-            # Defensive parsing checks
-            chart_data = response_json.get("chart", {})
-            chart_result = chart_data.get("result")
-            chart_error = chart_data.get("error")
+    Returns:
+        pd.DataFrame: One column per metric with DatetimeIndex.
+                      Returns an empty DataFrame if fetching fails.
+    """
+    return _cm_paginate(list(metrics), asset, start, freq)
 
-            if chart_error or chart_result is None:
-                error_desc = (
-                    chart_error.get("description", "Result is null")
-                    if chart_error
-                    else "Result is null"
-                )
-                if "Data doesn't exist" in error_desc or "No data found" in error_desc:
-                    logging.info(
-                        f"^NDX API reported no data for {start} to {end}: {error_desc}"
-                    )
-                else:
-                    logging.error(f"^NDX API Error for {start} to {end}: {error_desc}")
-                start = end + timedelta(days=1)
-                continue
 
-            if not isinstance(chart_result, list) or not chart_result:
-                logging.warning(
-                    f"^NDX API 'result' is not a non-empty list for {start} to {end}. Skipping. Result: {str(chart_result)[:200]}..."
-                )
-                start = end + timedelta(days=1)
-                continue
+def cm_fetch_many(
+    metrics: list[str],
+    asset: str = "eth",
+    start: str = "2015-08-01",
+    freq: str = "1d",
+) -> dict[str, pd.Series]:
+    """Fetches several CoinMetrics metrics, batched into one request.
 
-            result_data = chart_result[0]
-            timestamps = result_data.get("timestamp")
-            indicators = result_data.get("indicators")
-            if timestamps is None or indicators is None:
-                logging.warning(
-                    f"Missing 'timestamp' or 'indicators' in ^NDX API result[0] for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    The metrics are requested together through cm_fetch_multi. If that
+    batch comes back empty (e.g. one metric is unavailable and the API
+    rejects the whole request), each metric is fetched through cm_fetch
+    instead, side by side on a thread pool.
 
-            quote = indicators.get("quote")
-            if not quote or not isinstance(quote, list) or not quote[0]:
-                logging.warning(
-                    f"Missing 'quote' array in ^NDX API indicators for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    Args:
+        metrics (list[str]): CoinMetrics metric IDs (e.g., ['AdrActCnt', 'TxCnt']).
+        asset (str): The asset ID (default: 'eth').
+        start (str): Start date in 'YYYY-MM-DD' format (default: '2015-08-01').
+        freq (str): Data frequency ('1d', '1h', etc.) (default: '1d').
 
-            close_prices = quote[0].get("close")
-            if close_prices is None:
-                logging.warning(
-                    f"Missing 'close' prices in ^NDX API quote[0] for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    Returns:
+        dict[str, pd.Series]: A Series for every metric, keyed by ID.
+    """
+    if len(metrics) > 1:
+        frame = cm_fetch_multi(metrics, asset=asset, start=start, freq=freq)
+        if not frame.empty:
+            result = {}
+            for metric in metrics:
+                # Batched rows span every metric; trim to this metric's own range
+                col = frame[metric].rename(metric)
+                first, last = col.first_valid_index(), col.last_valid_index()
+                result[metric] = col.iloc[:0] if first is None else col.loc[first:last]
+            return result
+        logging.warning(
+            f"Batched CoinMetrics request for {','.join(metrics)} returned no data; "
+            "falling back to one request per metric."
+        )
 
-            if not isinstance(timestamps, list) or not isinstance(close_prices, list):
-                logging.warning(
-                    f"Timestamps or close_prices are not lists for NASDAQ {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
+    with ThreadPoolExecutor(max_workers=_CM_MAX_WORKERS) as pool:
+        futures = {
+            metric: pool.submit(cm_fetch, metric, asset=asset, start=start, freq=freq)
+            for metric in metrics
+        }
+    return {metric: future.result() for metric, future in futures.items()}
 
-            if len(close_prices) != len(timestamps):
-                logging.warning(
-                    f"Mismatch length for close/timestamps in ^NDX API response for {start} to {end}. Skipping."
-                )
-                start = end + timedelta(days=1)
-                continue
 
-            # Create Series, ensuring index matches non-null data points
-            valid_indices = [
-                i for i, price in enumerate(close_prices) if price is not None
-            ]
-            if not valid_indices:
-                logging.info(
-                    f"No valid (non-null) NASDAQ price data found for chunk {start} to {end}."
-                )
-            else:
-                valid_timestamps = [timestamps[i] for i in valid_indices]
-                valid_prices = [close_prices[i] for i in valid_indices]
-                series_data = pd.Series(
-                    valid_prices,
-                    index=pd.to_datetime(valid_timestamps, unit="s", utc=True)
-                    .tz_convert(None)
-                    .normalize(),
-                    name="nasdaq",
-                )
-                pieces.append(series_data)
-                logging.debug(
-                    f"Successfully processed ^NDX chunk {start} to {end}, got {len(series_data)} data points."
-                )
+@disk_cache("nasdaq_ndx.feather", max_age_hr=24)
+def fetch_nasdaq() -> pd.Series:
+    """Fetches true-daily ^NDX close from Yahoo via RapidAPI (chunked).
 
-        except (
-            RuntimeError,
-            requests.exceptions.RequestException,
-            json.JSONDecodeError,
-            ValueError,  # Catch potential ValueError from robust_get
-        ) as req_err:
-            logging.error(
-                f"Handled error during NASDAQ fetch/parse for chunk {start} to {end}: {req_err}. Skipping chunk."
-            )
-        except Exception as e:
-            logging.error(
-                f"Unexpected error processing NASDAQ chunk {start} to {end}: {e}",
-                exc_info=True,
-            )
-        finally:
-            # Ensure 'start' is always incremented
-            start = end + timedelta(days=1)
-            # Add a small delay to avoid hitting rate limits
-            time.sleep(random.uniform(0.2, 0.5))  # nosec B311
+    Uses disk caching defined in utils.py (assumed to use settings.DATA_DIR).
 
-    if not pieces:
-        logging.error(
-            "No NASDAQ data pieces were collected after processing all chunks."
-        )
-        # Return an empty Series with the correct structure
-        return pd.Series(dtype=float, index=pd.to_datetime([]), name="nasdaq")
-        # Or raise: raise RuntimeError("No NASDAQ data successfully fetched after processing all chunks.")
-
-    logging.info("Finished NASDAQ fetch. Concatenating %d pieces.", len(pieces))
-    ndx_series = (
-        pd.concat(pieces).sort_index().loc[lambda s: ~s.index.duplicated()]
-    )  # De-duplicate just in case
-
-    # Ensure final result index is timezone-naive (should be handled by disk_cache too)
-    if (
-        pd.api.types.is_datetime64_any_dtype(ndx_series.index)
-        and ndx_series.index.tz is not None
-    ):
-        ndx_series.index = ndx_series.index.tz_localize(None)
-
-    return ndx_series
+    Returns:
+        pd.Series: A pandas Series named 'nasdaq' with DatetimeIndex.
+                   Returns an empty Series if fetching fails.
+    """
+    start = date(1985, 1, 1)  # Earliest ^NDX on Yahoo
+    return _yf_daily_fetch("^NDX", "yf_ndx", start, "nasdaq")
+
+
+def fetch_all(metrics: list[str], asset: str = "eth") -> dict[str, Any]:
+    """Fetches ETH price, NASDAQ and CoinMetrics metrics side by side.
+
+    The three sources live on different hosts, so wall clock becomes the
+    slowest of them rather than their sum. Every fetch keeps its own disk
+    cache, so a later plain fetch_nasdaq() call is a cache hit. The metrics
+    are cached together in one cm_fetch_multi file (e.g.
+    'cm_eth_multi_AdrActCnt-TxCnt.feather'), so a later cm_fetch_many() with
+    the same metric list is a hit; the per-metric cm_fetch() caches are only
+    written when the batched request fails and cm_fetch_many falls back.
+
+    Args:
+        metrics (list[str]): CoinMetrics metric IDs passed to cm_fetch_many.
+        asset (str): The CoinMetrics asset ID (default: 'eth').
+
+    Returns:
+        dict[str, Any]: ``eth_price`` (DataFrame), ``nasdaq`` (Series) and
+                        ``cm`` (dict of metric -> Series).
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        eth_price = pool.submit(fetch_eth_price_rapidapi)
+        nasdaq = pool.submit(fetch_nasdaq)
+        cm = pool.submit(cm_fetch_many, metrics, asset=asset)
+    return {
+        "eth_price": eth_price.result(),
+        "nasdaq": nasdaq.result(),
+        "cm": cm.result(),
+    }
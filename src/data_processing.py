@@ -15,15 +15,14 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING  # Added Any import
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
 # Import settings, helpers from utils and data_fetching
-from src.config import settings
+from src.config import get_settings
 
-from .data_fetching import cm_fetch, fetch_eth_price_rapidapi, fetch_nasdaq
-from .utils import load_parquet
+from .data_fetching import fetch_all, fetch_nasdaq
+from .utils import load_parquet, parquet_columns, save_parquet, save_series_parquet
 
 if TYPE_CHECKING:
     from matplotlib.figure import Figure
@@ -39,6 +38,10 @@ def _plot_core_data(df: pd.DataFrame, filename: str) -> None:
         df (pd.DataFrame): DataFrame containing 'price_usd', 'active_addr', 'supply'.
         filename (str): The filename (relative to project root) to save the plot.
     """
+    # pyplot costs ~0.4 s to import and is only needed on the (rare) runs that
+    # just fetched raw data, so it is imported here rather than at module load
+    import matplotlib.pyplot as plt
+
     logging.info("Plotting raw core data diagnostics...")
     try:
         fig: Figure
@@ -46,7 +49,7 @@ def _plot_core_data(df: pd.DataFrame, filename: str) -> None:
         axes: np.ndarray
         fig, axes = plt.subplots(3, 1, figsize=(12, 9), sharex=True)
         # Save plot in project root using settings for consistency
-        plot_path = settings.DATA_DIR / filename
+        plot_path = get_settings().DATA_DIR / filename
 
         # Add checks for empty data before plotting
         if "price_usd" in df.columns and not df["price_usd"].dropna().empty:
@@ -95,9 +98,10 @@ def ensure_raw_data_exists(
               False otherwise.
     """
     logging.info("Ensuring raw data files exist...")
-    core_path = settings.DATA_DIR / "eth_core.parquet"
-    tx_path = settings.DATA_DIR / "eth_tx.parquet"
-    fee_path = settings.DATA_DIR / "eth_fee.parquet"
+    data_dir = get_settings().DATA_DIR
+    core_path = data_dir / "eth_core.parquet"
+    tx_path = data_dir / "eth_tx.parquet"
+    fee_path = data_dir / "eth_fee.parquet"
 
     # Check if ALL essential files exist
     if core_path.exists() and tx_path.exists() and fee_path.exists():
@@ -109,9 +113,15 @@ def ensure_raw_data_exists(
     )
 
     try:
-        # Fetch core components (uses cache internally if available)
-        logging.info("Fetching ETH price...")
-        price_df = fetch_eth_price_rapidapi()  # Returns DataFrame
+        # Determine correct fee metric name (handle potential variations)
+        fee_metric = "FeeTotNtv"  # Default
+        # Add logic here if FeeTotNtv fails, try FeeBurnNtv etc. if needed
+
+        # Fetch all sources concurrently (each uses its cache if available).
+        # NASDAQ is only warmed here; align_nasdaq_data reads it from cache.
+        logging.info("Fetching ETH price, NASDAQ and on-chain metrics...")
+        fetched = fetch_all(["AdrActCnt", "SplyCur", "TxCnt", fee_metric])
+        price_df = fetched["eth_price"]  # Returns DataFrame
         if price_df.empty:
             logging.warning(
                 "ETH price fetch returned empty DataFrame. Core data might be incomplete."
@@ -119,16 +129,24 @@ def ensure_raw_data_exists(
             # Create empty df to allow merge to proceed but result might be unusable
             price_df = pd.DataFrame(columns=["price_usd"], index=pd.to_datetime([]))
 
-        logging.info("Fetching ETH active addresses...")
-        active_series = cm_fetch("AdrActCnt").rename("active_addr")
-        logging.info("Fetching ETH supply...")
-        supply_series = cm_fetch("SplyCur").rename("supply")
+        metrics = fetched["cm"]
+        active_series = metrics["AdrActCnt"].rename("active_addr")
+        supply_series = metrics["SplyCur"].rename("supply")
 
         # Combine core data
         logging.info("Combining and aligning core data...")
-        # Use outer join to keep all dates initially, then align
-        core_df = pd.concat(
-            [price_df, active_series, supply_series], axis=1, join="outer"
+        # Outer-join all dates: build the union index once and reindex each
+        # series onto it, so the frame is assembled from aligned arrays
+        union_index = price_df.index.union(active_series.index).union(
+            supply_series.index
+        )
+        core_df = pd.DataFrame(
+            {
+                "price_usd": price_df["price_usd"].reindex(union_index),
+                "active_addr": active_series.reindex(union_index),
+                "supply": supply_series.reindex(union_index),
+            },
+            copy=False,
         )
 
         # Forward fill missing values - crucial for daily data alignment
@@ -144,26 +162,19 @@ def ensure_raw_data_exists(
             return False
 
         # Save core data
-        core_df.reset_index(names="time").to_parquet(core_path, index=False)
+        save_parquet(core_df.reset_index(names="time"), core_path, index=False)
         logging.info(f"Saved raw core data to {core_path} ({core_df.shape})")
 
         if plot_diagnostics:
             _plot_core_data(core_df, filename=filename)
 
-        # Fetch and save extra metrics
-        logging.info("Fetching ETH transaction count...")
-        tx_series = cm_fetch("TxCnt").rename("tx_count")
-        tx_series.to_frame().reset_index(names="time").to_parquet(tx_path, index=False)
+        # Save extra metrics
+        tx_series = metrics["TxCnt"].rename("tx_count")
+        save_series_parquet(tx_series, tx_path)
         logging.info(f"Saved raw tx data to {tx_path} ({tx_series.shape})")
 
-        logging.info("Fetching ETH total native fees...")
-        # Determine correct fee metric name (handle potential variations)
-        fee_metric = "FeeTotNtv"  # Default
-        # Add logic here if FeeTotNtv fails, try FeeBurnNtv etc. if needed
-        fee_series = cm_fetch(fee_metric).rename("fee_native")  # Keep consistent name
-        fee_series.to_frame().reset_index(names="time").to_parquet(
-            fee_path, index=False
-        )
+        fee_series = metrics[fee_metric].rename("fee_native")  # Keep consistent name
+        save_series_parquet(fee_series, fee_path)
         logging.info(f"Saved raw fee data to {fee_path} ({fee_series.shape})")
 
         logging.info("Raw data fetching and saving complete.")
@@ -193,23 +204,24 @@ def load_raw_data() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     logging.info("Loading raw parquet files...")
     try:
-        core_path = settings.DATA_DIR / "eth_core.parquet"
-        fee_path = settings.DATA_DIR / "eth_fee.parquet"
-        tx_path = settings.DATA_DIR / "eth_tx.parquet"
+        data_dir = get_settings().DATA_DIR
+        core_path = data_dir / "eth_core.parquet"
+        fee_path = data_dir / "eth_fee.parquet"
+        tx_path = data_dir / "eth_tx.parquet"
 
         core_df = load_parquet(core_path, ["price_usd", "active_addr", "supply"])
         logging.info("Loaded core data: %s rows", core_df.shape[0])
 
-        fee_df = load_parquet(fee_path)
-        # Find the correct fee/burn column case-insensitively
+        # Find the correct fee/burn column case-insensitively from the schema,
+        # then decode only that column
+        fee_cols = [c for c in parquet_columns(fee_path) if c != "time"]
         fee_col_options = {"feeburnntv", "feetotntv", "fee_native", "burn"}
-        burn_col = next(
-            (c for c in fee_df.columns if c.lower() in fee_col_options), None
-        )
+        burn_col = next((c for c in fee_cols if c.lower() in fee_col_options), None)
         if burn_col is None:
             raise ValueError(
-                f"Could not find a fee/burn column in {fee_path.name}. Found: {fee_df.columns.tolist()}"
+                f"Could not find a fee/burn column in {fee_path.name}. Found: {fee_cols}"
             )
+        fee_df = load_parquet(fee_path, [burn_col])
         fee_df = fee_df[[burn_col]].rename(columns={burn_col: "burn"})
         logging.info("Loaded fee data: %s rows", fee_df.shape[0])
 
@@ -258,10 +270,11 @@ def merge_eth_data(
     logging.info("Initial merged df shape: %s", df.shape)
     # Check for unexpected NaNs in core columns after merge
     core_cols = ["price_usd", "active_addr", "supply", "market_cap"]
-    if df[core_cols].isnull().any().any():
-        logging.warning(
-            f"NaNs found in core columns after merge: \n{df[core_cols].isnull().sum()}"
-        )
+    nan_mask = np.isnan(df[core_cols].to_numpy(dtype=np.float64))
+    if nan_mask.any():
+        # Per-column counts are only needed for the (rare) warning
+        nan_counts = dict(zip(core_cols, nan_mask.sum(axis=0).tolist()))
+        logging.warning("NaNs found in core columns after merge: %s", nan_counts)
         # Optional: Decide whether to drop these rows here or let later steps handle it
         # df = df.dropna(subset=core_cols)
         # logging.info("Shape after dropping rows with NaNs in core columns: %s", df.shape)
@@ -273,9 +286,8 @@ def align_nasdaq_data(eth_df: pd.DataFrame) -> pd.DataFrame:
     """Fetches/loads NASDAQ data, aligns it, and joins it to the ETH DataFrame.
 
     Fetches NASDAQ (^NDX) data using fetch_nasdaq (which utilizes caching).
-    Resamples NASDAQ data to daily frequency using forward fill. Aligns the
-    daily NASDAQ data to the date range of the input eth_df and joins it
-    as a new 'nasdaq' column.
+    Each date of eth_df takes the most recent NASDAQ close on or before it
+    (a forward-fill as-of lookup), joined as a new 'nasdaq' column.
 
     Args:
         eth_df (pd.DataFrame): The DataFrame containing merged ETH data.
@@ -299,37 +311,24 @@ def align_nasdaq_data(eth_df: pd.DataFrame) -> pd.DataFrame:
         max_eth_date = eth_df.index.max()
         logging.info("Aligning NASDAQ data from %s to %s", min_eth_date, max_eth_date)
 
-        # Forward-fill on a daily frequency *before* slicing
-        ndx_raw = ndx_raw.sort_index()  # Ensure sorted
-        # Create a full daily index from the start of NASDAQ to max_eth_date
-        full_daily_index = pd.date_range(
-            start=ndx_raw.index.min(), end=max_eth_date, freq="D"
-        )
-        # Reindex NASDAQ data to this full index, then forward fill
-        ndx_daily = ndx_raw.reindex(full_daily_index).ffill()
-        # Now slice based on the eth_df index range
-        ndx_daily_aligned = ndx_daily.loc[min_eth_date:max_eth_date]
-        logging.info(
-            "Daily NASDAQ data shape after alignment: %s", ndx_daily_aligned.shape
-        )
+        # As-of lookup: each ETH date takes the latest NASDAQ close on or before
+        # it (weekends/holidays carry Friday's close), without building and
+        # forward-filling a full daily calendar first
+        ndx_sorted = ndx_raw.dropna().sort_index()
+        ndx_sorted = ndx_sorted[~ndx_sorted.index.duplicated(keep="last")]
+        ndx_aligned = ndx_sorted.reindex(eth_df.index, method="ffill")
+        logging.info("Daily NASDAQ data shape after alignment: %s", ndx_aligned.shape)
 
         logging.info("Joining NASDAQ data into main DataFrame...")
-        df_with_nasdaq = eth_df.join(
-            ndx_daily_aligned.rename("nasdaq")
-        )  # Ensure name is 'nasdaq'
+        df_with_nasdaq = eth_df.assign(nasdaq=ndx_aligned.to_numpy())
 
-        # Check for NaNs introduced by NASDAQ join within the ETH range
-        nasdaq_nan_count = (
-            df_with_nasdaq["nasdaq"].loc[min_eth_date:max_eth_date].isnull().sum()
-        )
+        # Check for NaNs left within the ETH data range (ETH dates before NASDAQ)
+        nasdaq_nan_count = df_with_nasdaq["nasdaq"].isnull().sum()
         if nasdaq_nan_count > 0:
             logging.warning(
                 "NASDAQ column has %s NaNs after join and ffill within the ETH data range.",
                 nasdaq_nan_count,
             )
-            # Optional: Backfill remaining NaNs if desired
-            # df_with_nasdaq['nasdaq'] = df_with_nasdaq['nasdaq'].bfill()
-            # logging.info("Backfilled remaining NASDAQ NaNs.")
 
         # Check if all NASDAQ values are NaN (e.g., if date ranges didn't overlap)
         if df_with_nasdaq["nasdaq"].isnull().all():
@@ -348,13 +347,22 @@ def align_nasdaq_data(eth_df: pd.DataFrame) -> pd.DataFrame:
 
 # --- Feature Engineering and Cleaning ---
 
+# Log feature -> source column; 'burn' (log1p) is the only one allowed to be 0
+_LOG_FEATURES = {
+    "log_marketcap": "market_cap",
+    "log_active": "active_addr",
+    "log_gas": "burn",
+    "log_nasdaq": "nasdaq",
+}
+_LOG1P_COL = list(_LOG_FEATURES).index("log_gas")
+
 
 def engineer_log_features(df: pd.DataFrame) -> pd.DataFrame:
     """Calculates log-transformed features for key variables.
 
     Computes natural logarithms for 'market_cap', 'active_addr', and 'nasdaq'.
-    Uses log(1 + x) for 'burn' to handle potential zero values. Replaces
-    any resulting infinities with NaN.
+    Uses log(1 + x) for 'burn' to handle potential zero values. Non-finite
+    results (from zero, negative or infinite inputs) become NaN.
 
     Args:
         df (pd.DataFrame): DataFrame containing the original features
@@ -365,22 +373,18 @@ def engineer_log_features(df: pd.DataFrame) -> pd.DataFrame:
                       'log_marketcap', 'log_active', 'log_gas', 'log_nasdaq'.
     """
     logging.info("Calculating log-scale features...")
-    df_out = df.copy()  # Avoid modifying original df
-
-    # Use np.log1p for columns that can be zero (like burn)
-    # Use np.log for columns that should be strictly positive (handle errors)
+    # One contiguous float64 block in, one log pass over it out; the result
+    # columns follow ``_LOG_FEATURES`` order
+    values = df[list(_LOG_FEATURES.values())].to_numpy(dtype=np.float64)
     with np.errstate(divide="ignore", invalid="ignore"):  # Suppress log(0) warnings
-        df_out["log_marketcap"] = np.log(df_out["market_cap"].replace(0, np.nan))
-        df_out["log_active"] = np.log(df_out["active_addr"].replace(0, np.nan))
-        df_out["log_gas"] = np.log1p(df_out["burn"])  # log1p handles burn=0
-        df_out["log_nasdaq"] = np.log(df_out["nasdaq"].replace(0, np.nan))
-
-    # Replace any -inf/inf resulting from logs of non-positive numbers with NaN
-    df_out.replace([np.inf, -np.inf], np.nan, inplace=True)
+        logs = np.log(values)
+        np.log1p(values[:, _LOG1P_COL], out=logs[:, _LOG1P_COL])  # burn can be 0
+    # log(0) = -inf, log(<0) = NaN and log(inf) = inf all become NaN
+    logs[~np.isfinite(logs)] = np.nan
+    df_out = df.assign(**dict(zip(_LOG_FEATURES, logs.T)))
 
     # Log how many NaNs were introduced or already present in log columns
-    log_cols = ["log_marketcap", "log_active", "log_gas", "log_nasdaq"]
-    nan_counts = df_out[log_cols].isnull().sum()
+    nan_counts = pd.Series(np.isnan(logs).sum(axis=0), index=list(_LOG_FEATURES))
     if nan_counts.any():
         logging.warning(
             f"NaNs found in log columns after calculation: \n{nan_counts[nan_counts > 0]}"
@@ -442,8 +446,13 @@ def create_monthly_clean(df_with_logs: pd.DataFrame) -> pd.DataFrame:
 
     # Resample using mean. Note: resampling before log transform differs from resampling after.
     # Original script resampled originals then took logs. Let's follow that.
-    # Ensure only numeric columns are used in mean calculation
-    numeric_cols = df_with_logs.select_dtypes(include=np.number).columns
+    # Only numeric source columns are averaged; the daily log columns would be
+    # overwritten by the monthly recalculation below, so they are skipped
+    numeric_cols = [
+        c
+        for c in df_with_logs.select_dtypes(include=np.number).columns
+        if c not in _LOG_FEATURES
+    ]
     monthly = df_with_logs[numeric_cols].resample("ME").mean()  # 'ME' for Month End
 
     # Recalculate logs based on monthly averages
@@ -472,6 +481,23 @@ def create_monthly_clean(df_with_logs: pd.DataFrame) -> pd.DataFrame:
 # --- Orchestration Function ---
 
 
+def save_processed_data(daily_clean: pd.DataFrame, monthly_clean: pd.DataFrame) -> None:
+    """Saves the cleaned frames as 'daily_clean.parquet' / 'monthly_clean.parquet'.
+
+    Other scripts read these files, so they are (re)written whenever the
+    pipeline produces the frames, including from a memoized result.
+    """
+    logging.info("Saving processed DataFrames...")
+    data_dir = get_settings().DATA_DIR
+    daily_clean_path = data_dir / "daily_clean.parquet"
+    monthly_clean_path = data_dir / "monthly_clean.parquet"
+
+    save_parquet(daily_clean, daily_clean_path)
+    save_parquet(monthly_clean, monthly_clean_path)
+    logging.info(f"Saved daily_clean to {daily_clean_path} ({daily_clean.shape})")
+    logging.info(f"Saved monthly_clean to {monthly_clean_path} ({monthly_clean.shape})")
+
+
 def process_all_data() -> tuple[pd.DataFrame, pd.DataFrame]:
     """Loads raw data, merges, adds features, cleans, and saves processed files.
 
@@ -512,16 +538,7 @@ def process_all_data() -> tuple[pd.DataFrame, pd.DataFrame]:
         monthly_clean = create_monthly_clean(df_with_logs)
 
         # 7. Save Processed DataFrames
-        logging.info("Saving processed DataFrames...")
-        daily_clean_path = settings.DATA_DIR / "daily_clean.parquet"
-        monthly_clean_path = settings.DATA_DIR / "monthly_clean.parquet"
-
-        daily_clean.to_parquet(daily_clean_path)
-        monthly_clean.to_parquet(monthly_clean_path)
-        logging.info(f"Saved daily_clean to {daily_clean_path} ({daily_clean.shape})")
-        logging.info(
-            f"Saved monthly_clean to {monthly_clean_path} ({monthly_clean.shape})"
-        )
+        save_processed_data(daily_clean, monthly_clean)
 
         return daily_clean, monthly_clean
 
@@ -16,7 +16,7 @@ import statsmodels.api as sm
 from sklearn.metrics import mean_squared_error
 
 # Import specific statsmodels types for hinting
-from statsmodels.regression.linear_model import OLS, RegressionResultsWrapper
+from statsmodels.regression.linear_model import OLS, OLSResults
 
 # --- OLS Fitting Function ---
 
@@ -37,7 +37,7 @@ def fit_ols_hac(
 
     Returns:
         Dict[str, Any]: A dictionary containing model results. Keys include:
-            - 'model_obj' (RegressionResultsWrapper | None): The fitted statsmodels
+            - 'model_obj' (OLSResults | None): The fitted statsmodels
               results object with HAC errors. None if fitting failed.
             - 'params' (Dict[str, float]): Dictionary of coefficient estimates.
             - 'pvals_hac' (Dict[str, float]): Dictionary of HAC p-values.
@@ -111,11 +111,13 @@ def fit_ols_hac(
 
     try:
         model: OLS = sm.OLS(y_fit, X_to_fit)
-        fit: RegressionResultsWrapper = model.fit()
-        # Apply HAC robust standard errors
-        hac_results: RegressionResultsWrapper = fit.get_robustcov_results(
-            cov_type="HAC", maxlags=lags
-        )
+        # Fit with HAC robust standard errors in a single pass rather than
+        # fitting a non-robust model and re-deriving it via
+        # get_robustcov_results(); use_t keeps t-based p-values as before.
+        # Unwrap to the plain OLSResults that get_robustcov_results returned.
+        hac_results: OLSResults = model.fit(
+            cov_type="HAC", cov_kwds={"maxlags": lags}, use_t=True
+        )._results
 
         # --- FIX for test_ols_beta_two ---
         model_col_names = X_to_fit.columns.tolist()
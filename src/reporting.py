@@ -2,6 +2,8 @@
 
 Provides:
 - A custom JSON encoder (`NpEncoder`) for handling NumPy types and NaN/Inf.
+- A writer (`write_results_json`) built on `utils.json_compat` (orjson when
+  it is installed).
 - A function (`generate_summary`) to compile results from various analysis
   steps into a structured dictionary and a human-readable interpretation text.
 """
@@ -10,11 +12,14 @@ from __future__ import annotations
 
 import json
 import logging
+from pathlib import Path
 from typing import Any, Dict, Sequence, Union  # Added Dict, Union
 
 import numpy as np
 import pandas as pd
 
+from .utils.json_compat import dumps_bytes
+
 
 # --- JSON Encoder for NumPy types ---
 class NpEncoder(json.JSONEncoder):
@@ -81,6 +86,67 @@ class NpEncoder(json.JSONEncoder):
             return str(obj)
 
 
+# Hoisted encoder: its ``default`` handles whatever json_compat can't encode.
+_NP_ENCODER = NpEncoder()
+
+
+def _normalize_numpy(value: Any) -> Any:
+    """Converts ``np.bool_``/``datetime64`` values to ``bool``/``pd.Timestamp``.
+
+    Values nested in dicts, lists and tuples are converted too. orjson encodes these natively (and writes NaT inside arrays as a bogus
+    1677 date) while the stdlib path would fall back to ``str()``; converting
+    first sends both paths through the same ``NpEncoder.default`` handling,
+    i.e. ``true``/``false``, ISO 8601 strings and null for NaT.
+    """
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.ndarray) and value.dtype.kind == "M":
+        return [pd.Timestamp(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _normalize_numpy(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_numpy(v) for v in value]
+    return value
+
+
+def _encode_value(value: Any) -> bytes:
+    """Encodes a single results value as compact JSON bytes.
+
+    DataFrames/Series go through pandas' C `to_json` in one pass instead of
+    per-element `NpEncoder.default` dispatch; everything else goes through
+    `json_compat.dumps_bytes` with `NpEncoder.default` as the fallback,
+    after `_normalize_numpy` so both encoders see the same types.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return str(value.to_json(orient="split", date_format="iso")).encode()
+    return dumps_bytes(_normalize_numpy(value), default=_NP_ENCODER.default)
+
+
+def write_results_json(results: Dict[str, Any], path: Path) -> None:
+    """Serializes a results dictionary to *path* as JSON.
+
+    Values are encoded one top-level key at a time and streamed to the file,
+    so no single string for the whole document is ever built. Encoding goes
+    through `utils.json_compat` (orjson when installed, stdlib otherwise;
+    both write NaN/Inf as null); types neither handles natively are routed
+    through `NpEncoder.default`.
+
+    Args:
+        results (Dict[str, Any]): The dictionary to serialize.
+        path (Path): Destination file; overwritten if it exists.
+    """
+    with open(path, "wb") as fp:
+        fp.write(b"{")
+        for i, (key, value) in enumerate(results.items()):
+            fp.write(b",\n  " if i else b"\n  ")
+            fp.write(dumps_bytes(str(key)))
+            fp.write(b": ")
+            fp.write(_encode_value(value))
+        fp.write(b"\n}\n" if results else b"}\n")
+
+
 # --- Summary Generation ---
 
 # Define a more specific type alias for the analysis results dictionary structure if known
@@ -1,15 +1,58 @@
-"""Utility package for ethereum_project, exposing core helpers."""
+"""Utility package for ethereum_project, exposing core helpers.
 
-from src.config import settings
+Helpers are imported from their submodules on first access, so importing a
+light submodule on its own (e.g. ``src.utils.json_compat`` from the scripts)
+does not pull in pandas, requests or the settings machinery.
+"""
 
-from .api_helpers import _save_api_snapshot, robust_get
-from .cache import disk_cache
-from .file_io import load_parquet
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.config import get_settings
+
+    from .api_helpers import _save_api_snapshot, robust_get
+    from .cache import disk_cache
+    from .file_io import (
+        load_parquet,
+        parquet_columns,
+        save_parquet,
+        save_series_parquet,
+    )
+
+# Re-exported name -> module that defines it
+_EXPORTS = {
+    "get_settings": "src.config",
+    "disk_cache": "src.utils.cache",
+    "robust_get": "src.utils.api_helpers",
+    "_save_api_snapshot": "src.utils.api_helpers",
+    "load_parquet": "src.utils.file_io",
+    "parquet_columns": "src.utils.file_io",
+    "save_parquet": "src.utils.file_io",
+    "save_series_parquet": "src.utils.file_io",
+}
 
 __all__ = [
+    "get_settings",
     "settings",
     "disk_cache",
     "robust_get",
     "_save_api_snapshot",
     "load_parquet",
+    "parquet_columns",
+    "save_parquet",
+    "save_series_parquet",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``settings`` is re-exported lazily, see src.config
+    if name == "settings":
+        return importlib.import_module("src.config").get_settings()
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
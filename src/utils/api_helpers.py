@@ -9,26 +9,30 @@ head-less CI (no disk-writes unless a directory is provided).
 Dependencies:
     * requests 2.x
     * urllib3 1.x (comes with requests)
-    * python-dotenv (optional) for `.env` loading
+    * orjson (optional, faster response decoding via json_compat)
 """
 
 from __future__ import annotations
 
 import json
 import logging
-
-# Removed time import as retries are handled by the session adapter
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Final, Mapping, MutableMapping, Optional
+from urllib.parse import urlsplit
 
 import requests
 
 # Imports for Session and Retry logic
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException  # Import base RequestException
+from urllib3.exceptions import InvalidHeader
 from urllib3.util.retry import Retry
 
+from . import json_compat
+
 # ---------------------------------------------------------------------
 # Constants & types
 # ---------------------------------------------------------------------
@@ -53,10 +57,16 @@ retry_strategy = Retry(
     allowed_methods=["HEAD", "GET", "OPTIONS"],  # Retry only on idempotent methods
     backoff_factor=1,  # sleep for {backoff factor} * (2 ** ({num_retries} - 1))
     # Note: urllib3 default includes handling of Retry-After header
+    # Hand back the last response once retries run out, so robust_get can read
+    # its Retry-After before raise_for_status() turns it into an HTTPError
+    raise_on_status=False,
 )
 
-# Create an adapter with the retry strategy
-adapter = HTTPAdapter(max_retries=retry_strategy)
+# Create an adapter with the retry strategy. Connections are kept alive and
+# pooled per host: pool_connections covers the few hosts we talk to, and
+# pool_maxsize lets the concurrent chunk/metric fetchers each reuse their own
+# TLS connection instead of opening throwaway ones once the pool is full.
+adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=4, pool_maxsize=16)
 
 # Create a global session object
 session = requests.Session()
@@ -65,6 +75,68 @@ session = requests.Session()
 session.mount("http://", adapter)
 session.mount("https://", adapter)
 
+
+# ---------------------------------------------------------------------
+# Client-side rate limiting
+# ---------------------------------------------------------------------
+
+# Sustained requests/second and burst size per host. The Yahoo RapidAPI
+# plan allows ~5 req/s; CoinMetrics' community API allows 10 per 6 s.
+_HOST_RATE_LIMITS: Final[Mapping[str, tuple[float, float]]] = {
+    "apidojo-yahoo-finance-v1.p.rapidapi.com": (5.0, 5.0),
+    "community-api.coinmetrics.io": (10 / 6, 10.0),
+}
+_DEFAULT_RATE_LIMIT: Final[tuple[float, float]] = (10.0, 10.0)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket shared by every caller hitting one host."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent, then consume one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._not_before and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._not_before - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def penalty(self, seconds: float) -> None:
+        """Hold back all callers for `seconds` (e.g. from a Retry-After header)."""
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+_buckets: Dict[str, _TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket_for(url: str) -> _TokenBucket:
+    """Return the (lazily created) token bucket for `url`'s host."""
+    host = urlsplit(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, capacity = _HOST_RATE_LIMITS.get(host, _DEFAULT_RATE_LIMIT)
+            bucket = _buckets[host] = _TokenBucket(rate, capacity)
+    return bucket
+
+
 # ---------------------------------------------------------------------
 # Snapshot helper
 # ---------------------------------------------------------------------
@@ -139,7 +211,9 @@ def robust_get(
     if headers:
         merged_headers.update(headers)
 
+    bucket = _bucket_for(url)
     try:
+        bucket.acquire()
         # Use the global session object
         resp = session.get(
             url,
@@ -150,11 +224,24 @@ def robust_get(
         # raise_for_status() is called implicitly by the adapter/retry logic
         # for statuses in retry_strategy.status_forcelist.
         # We still need to check for other 4xx errors if not in the forcelist.
+        if resp.status_code == 429:
+            # Still throttled after the adapter's retries: slow every caller
+            # of this host down instead of letting each one back off alone
+            delay = 0.0
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = retry_strategy.parse_retry_after(retry_after)
+                except InvalidHeader:
+                    logging.debug(f"Ignoring malformed Retry-After: {retry_after!r}")
+            bucket.penalty(max(delay, 1.0))
         resp.raise_for_status()  # Check for any non-retried 4xx/5xx errors
 
         # Attempt to parse JSON
         try:
-            data: Any = resp.json()
+            # CoinMetrics pages carry up to 10k records; decode them straight
+            # from the response bytes (with orjson when installed)
+            data: Any = json_compat.loads(resp.content)
         except json.JSONDecodeError as json_err:
             logging.error(f"Failed to decode JSON response from {url}: {json_err}")
             logging.debug(f"Response text: {resp.text[:500]}...")  # Log snippet of text
@@ -5,12 +5,15 @@ import json
 import logging
 import shutil
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any, Callable, Dict  # Import Dict
 
 import pandas as pd
 
 # Import settings from config relative to the src directory
-from src.config import settings
+from src.config import get_settings
+
+from .file_io import save_parquet
 
 # Safe import for filelock - raise error if missing
 try:
@@ -22,13 +25,35 @@ except ModuleNotFoundError as e:
     ) from e
 
 
+def _read_cached(path: Path) -> pd.DataFrame:
+    """Reads a cache file in the format implied by its suffix."""
+    if path.suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_parquet(path)
+
+
+def _write_cached(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    """Writes ``df`` to ``path`` as Feather (``fmt == ".feather"``) or Parquet.
+
+    Feather (Arrow IPC) is written uncompressed: the small, read-hot series
+    cached with it load faster without a decode step, while larger frames
+    keep Parquet's compression.
+    """
+    if fmt == ".feather":
+        df.to_feather(path, compression="uncompressed")
+    else:
+        save_parquet(df, path)
+
+
 def disk_cache(
     path_arg_template: str, max_age_hr: int = 24
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Decorator to cache pandas DataFrame/Series to disk (Parquet).
+    """Decorator to cache pandas DataFrame/Series to disk (Parquet or Feather).
 
     Supports dynamic path formatting based on function arguments.
     Example: @disk_cache("item_{arg1}_{kwarg2}.parquet")
+    List/tuple arguments are joined with "-" in the filename.
+    A ``.feather`` suffix stores the result as uncompressed Arrow IPC instead.
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -42,7 +67,11 @@ def disk_cache(
                 bound_args = sig.bind(*args, **kwargs)
                 bound_args.apply_defaults()
                 # Create a dictionary of all arguments for formatting
-                format_dict: Dict[str, Any] = bound_args.arguments
+                format_dict: Dict[str, Any] = {
+                    # List arguments (e.g. several metric IDs) are joined with "-"
+                    k: "-".join(map(str, v)) if isinstance(v, (list, tuple)) else v
+                    for k, v in bound_args.arguments.items()
+                }
                 # Format the path template using the arguments
                 cache_filename = path_arg_template.format(**format_dict)
             except (TypeError, ValueError, KeyError) as fmt_err:
@@ -55,7 +84,7 @@ def disk_cache(
                 # Execute function without caching if path formatting fails
                 return func(*args, **kwargs)
 
-            cache_path = settings.DATA_DIR / cache_filename
+            cache_path = get_settings().DATA_DIR / cache_filename
             lock_path = cache_path.with_suffix(".lock")
             meta_path = cache_path.with_suffix(".meta.json")
             # --- End dynamic path determination ---
@@ -82,7 +111,7 @@ def disk_cache(
                                     f"Could not read cache metadata for {cache_path.name}: {meta_e}"
                                 )
 
-                        df = pd.read_parquet(cache_path)
+                        df = _read_cached(cache_path)
                         if pandas_type == "Series" or (
                             pandas_type is None and df.shape[1] == 1
                         ):
@@ -132,9 +161,8 @@ def disk_cache(
                                 )  # Example fallback
                                 result_to_save.name = str(series_name)
 
-                            result_to_save.to_frame().to_parquet(tmp_path, index=True)
-                        else:  # is_dataframe
-                            result_to_save.to_parquet(tmp_path, index=True)
+                            result_to_save = result_to_save.to_frame()
+                        _write_cached(result_to_save, tmp_path, cache_path.suffix)
 
                         # Move temporary file to final cache path
                         shutil.move(
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import shutil
 import subprocess  # nosec B404 (subprocess is required for docker build)
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 __all__: list[str] = [
@@ -28,7 +28,10 @@ def _append_to_log(log_file: Path, message: str) -> None:
     # Ensure parent directory exists
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    # Aware UTC time; datetime.utcnow() is deprecated since Python 3.12
+    timestamp = (
+        datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    )
     with log_file.open("a", encoding="utf-8") as fp:
         fp.write(f"[{timestamp}] {message}\n")
 
@@ -2,17 +2,83 @@
 
 import logging
 from pathlib import Path
+from typing import Any, Dict
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def _parquet_write_options(df: pd.DataFrame) -> Dict[str, Any]:
+    """pyarrow writer options suited to the project's numeric time series.
+
+    Float columns skip dictionary encoding (prices and metrics rarely repeat)
+    and use BYTE_STREAM_SPLIT, which compresses far better under ZSTD. A
+    datetime column (unique per row) is not dictionary-encoded either.
+    """
+    float_cols = [str(c) for c in df.columns if pd.api.types.is_float_dtype(df[c])]
+    dict_cols = [
+        str(c)
+        for c in df.columns
+        if str(c) not in float_cols and not pd.api.types.is_datetime64_any_dtype(df[c])
+    ]
+    return {
+        "engine": "pyarrow",
+        "compression": "zstd",
+        "use_dictionary": dict_cols,
+        "use_byte_stream_split": float_cols,
+    }
+
+
+def save_parquet(df: pd.DataFrame, path: Path, *, index: bool = True) -> None:
+    """Writes parquet with pyarrow + ZSTD (see ``_parquet_write_options``)."""
+    df.to_parquet(path, index=index, **_parquet_write_options(df))
+
+
+def save_series_parquet(series: pd.Series, path: Path) -> None:
+    """Writes a time-indexed Series as a two-column ('time', name) parquet.
+
+    The Arrow table is built straight from the index and value arrays, so no
+    intermediate DataFrame is materialized; writer options match
+    ``save_parquet``.
+    """
+    name = str(series.name)
+    table = pa.table({"time": series.index.to_numpy(), name: series.to_numpy()})
+    float_cols = [name] if pd.api.types.is_float_dtype(series) else []
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        use_dictionary=False,
+        use_byte_stream_split=float_cols or False,
+    )
+
+
+def parquet_columns(path: Path) -> list[str]:
+    """Column names of a parquet file, read from its footer only."""
+    if not path.exists():
+        logging.error(f"Parquet file not found: {path}")
+        raise FileNotFoundError(path)
+    return list(pq.read_schema(path).names)
 
 
 def load_parquet(path: Path, req_cols: list[str] | None = None) -> pd.DataFrame:
-    """Loads parquet, ensures 'time' index, checks columns."""
+    """Loads parquet, ensures 'time' index, checks columns.
+
+    With ``req_cols``, only 'time' and those columns are decoded (the file is
+    memory-mapped), unless the file has no 'time' column to project onto.
+    """
     if not path.exists():
         logging.error(f"Parquet file not found: {path}")
         raise FileNotFoundError(path)
     try:
-        df = pd.read_parquet(path)
+        columns = None
+        if req_cols:
+            names = pq.read_schema(path).names
+            if "time" in names:
+                # Missing required columns are reported by the check below
+                columns = ["time", *(c for c in req_cols if c in names)]
+        df = pd.read_parquet(path, columns=columns, memory_map=True)
         # Ensure 'time' column exists before setting index
         if "time" not in df.columns:
             if df.index.name == "time":
@@ -0,0 +1,86 @@
+# src/utils/json_compat.py
+
+"""JSON encoding/decoding that uses orjson when it is installed.
+
+Both paths write the same text: compact separators (or a 2-space indent),
+raw UTF-8 rather than \\u escapes, and NaN/Inf floats as null.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable
+
+# orjson is an optional accelerator; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None  # type: ignore[assignment]  # module stand-in when absent
+
+
+def _nonfinite_to_none(value: Any) -> Any:
+    """Replaces NaN/Inf floats (nested in dicts/lists/tuples) with None.
+
+    The stdlib encoder writes plain floats itself (``np.float64`` included),
+    emitting bare ``NaN``/``Infinity`` where orjson writes null.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _nonfinite_to_none(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_nonfinite_to_none(v) for v in value]
+    return value
+
+
+def loads(data: str | bytes) -> Any:
+    """Decodes a JSON document; raises ``json.JSONDecodeError`` on bad input."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: bool = False,
+    sort_keys: bool = False,
+) -> bytes:
+    """Encodes ``obj`` as UTF-8 JSON bytes.
+
+    Args:
+        obj (Any): The value to encode. NumPy arrays/scalars are handled
+            natively by orjson; pass ``default`` for the stdlib path.
+        default (Callable | None): Called for objects neither encoder
+            supports natively (e.g. ``NpEncoder.default``).
+        indent (bool): Pretty-print with a 2-space indent.
+        sort_keys (bool): Sort object keys; otherwise insertion order is kept.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        _nonfinite_to_none(obj),
+        default=default,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+    ).encode()
+
+
+def dumps(
+    obj: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+    indent: bool = False,
+    sort_keys: bool = False,
+) -> str:
+    """Like ``dumps_bytes``, but returns ``str``."""
+    return dumps_bytes(
+        obj, default=default, indent=indent, sort_keys=sort_keys
+    ).decode()
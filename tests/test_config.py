@@ -0,0 +1,18 @@
+import pytest
+
+import src.config as config
+from src.config import Settings, get_settings
+
+
+def test_get_settings_returns_singleton():
+    """Repeated calls (and the legacy ``settings`` name) share one instance."""
+    first = get_settings()
+
+    assert isinstance(first, Settings)
+    assert get_settings() is first
+    assert config.settings is first
+
+
+def test_unknown_config_attribute_raises():
+    with pytest.raises(AttributeError):
+        config.does_not_exist
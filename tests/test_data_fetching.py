@@ -12,7 +12,14 @@ from requests.exceptions import RequestException
 
 # Assuming src is importable via conftest.py
 from src.config import settings
-from src.data_fetching import cm_fetch, fetch_eth_price_rapidapi, fetch_nasdaq
+from src.data_fetching import (
+    _parse_yf_chart,
+    cm_fetch,
+    cm_fetch_many,
+    fetch_all,
+    fetch_eth_price_rapidapi,
+    fetch_nasdaq,
+)
 
 # --- Fixtures ---
 
@@ -28,6 +35,27 @@ def manage_fetch_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     yield test_cache_dir
 
 
+def _yf_daily_response(period1: int, period2: int) -> dict:
+    """A YF chart response with one close per day in [period1, period2)."""
+    timestamps = list(range(period1, period2, 86400))
+    return {
+        "chart": {
+            "result": [
+                {
+                    "timestamp": timestamps,
+                    "indicators": {"quote": [{"close": [1.0] * len(timestamps)}]},
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+def _yf_window_get(*_args, params: dict, **_kwargs) -> dict:
+    """robust_get stand-in answering each request with its full window."""
+    return _yf_daily_response(params.get("period1", 0), params.get("period2", 0))
+
+
 # --- Fixtures for YF API (Shared by ETH and NASDAQ) ---
 @pytest.fixture
 def mock_yf_success_response() -> dict:
@@ -164,7 +192,7 @@ def test_fetch_eth_price_happy_path(
         check_names=False,  # Allow name mismatch as mock is generic YF
     )
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "eth_price_yf.parquet"
+    cache_file = manage_fetch_cache_dir / "eth_price_yf.feather"
     assert cache_file.exists()
     meta_file = manage_fetch_cache_dir / "eth_price_yf.meta.json"
     assert meta_file.exists()
@@ -182,9 +210,9 @@ def test_fetch_eth_price_api_error(
     assert df_result.empty
     assert df_result.columns == ["price_usd"]
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "eth_price_yf.parquet"
+    cache_file = manage_fetch_cache_dir / "eth_price_yf.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
 
 
@@ -200,9 +228,9 @@ def test_fetch_eth_price_no_data(
     assert df_result.empty
     assert df_result.columns == ["price_usd"]
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "eth_price_yf.parquet"
+    cache_file = manage_fetch_cache_dir / "eth_price_yf.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
 
 
@@ -218,9 +246,9 @@ def test_fetch_eth_price_malformed_response(
     assert df_result.empty
     assert df_result.columns == ["price_usd"]
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "eth_price_yf.parquet"
+    cache_file = manage_fetch_cache_dir / "eth_price_yf.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
 
 
@@ -234,12 +262,123 @@ def test_fetch_eth_price_robust_get_exception(
     assert df_result.empty
     assert df_result.columns == ["price_usd"]
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "eth_price_yf.parquet"
+    cache_file = manage_fetch_cache_dir / "eth_price_yf.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
 
 
+@patch("src.data_fetching.robust_get")
+def test_fetch_eth_price_reuses_settled_chunks(
+    mock_robust_get: MagicMock,
+    mock_yf_success_response: dict,
+    manage_fetch_cache_dir: Path,
+):
+    """Once cached, only the recent (still revisable) chunks are re-requested."""
+    mock_robust_get.return_value = mock_yf_success_response
+    first = fetch_eth_price_rapidapi()
+    assert list((manage_fetch_cache_dir / "yf_chunks").glob("yf_eth_*.parquet"))
+
+    # Expire the whole-result cache so the function body runs again
+    (manage_fetch_cache_dir / "eth_price_yf.feather").unlink()
+    mock_robust_get.reset_mock()
+    second = fetch_eth_price_rapidapi()
+
+    # One request, and it only covers the last ~2 years (1-2 open windows)
+    assert mock_robust_get.call_count == 1
+    period1 = mock_robust_get.call_args.kwargs["params"]["period1"]
+    assert period1 > datetime.now(tz=timezone.utc).timestamp() - 2 * 366 * 86400
+    pd.testing.assert_frame_equal(first, second)
+
+
+@patch("src.data_fetching.robust_get")
+def test_fetch_nasdaq_uses_single_request_for_full_history(
+    mock_robust_get: MagicMock, manage_fetch_cache_dir: Path
+):
+    """A usable span response replaces the per-window requests."""
+    mock_robust_get.side_effect = _yf_window_get
+    series_result = fetch_nasdaq()
+
+    assert series_result.index[0] == pd.Timestamp("1985-01-01")
+    assert series_result.index.is_unique
+    # firstTradeDate probe (no meta in the mock) + one span request
+    assert mock_robust_get.call_count == 2
+    params = mock_robust_get.call_args.kwargs["params"]
+    assert params["period1"] == int(
+        datetime(1985, 1, 1, tzinfo=timezone.utc).timestamp()
+    )
+
+
+@patch("src.data_fetching.robust_get")
+def test_fetch_nasdaq_refetches_windows_a_late_span_misses(
+    mock_robust_get: MagicMock, manage_fetch_cache_dir: Path
+):
+    """Windows before a late-starting span response are requested on their own."""
+    span_start = int(datetime(1985, 1, 1, tzinfo=timezone.utc).timestamp())
+    late_start = int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp())
+
+    def yf_get(*args, params: dict, **kwargs) -> dict:
+        if params.get("period1") == span_start and params["period2"] > late_start:
+            return _yf_daily_response(late_start, params["period2"])
+        return _yf_window_get(*args, params=params, **kwargs)
+
+    mock_robust_get.side_effect = yf_get
+    series_result = fetch_nasdaq()
+
+    assert series_result.index[0] == pd.Timestamp("1985-01-01")
+    # The first window is cached with its own (non-empty) response
+    first_chunk = next((manage_fetch_cache_dir / "yf_chunks").glob("yf_ndx_19850101_*"))
+    assert len(pd.read_parquet(first_chunk)) > 300
+
+
+@patch("src.data_fetching.robust_get")
+def test_fetch_nasdaq_falls_back_to_chunks_when_span_truncated(
+    mock_robust_get: MagicMock, manage_fetch_cache_dir: Path
+):
+    """A coarser-than-daily span response triggers the chunked requests."""
+    month = 30 * 86400
+    t0 = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp())
+    monthly = {
+        "chart": {
+            "result": [
+                {
+                    "timestamp": [t0, t0 + month, t0 + 2 * month],
+                    "indicators": {"quote": [{"close": [1.0, 2.0, 3.0]}]},
+                }
+            ],
+            "error": None,
+        }
+    }
+    mock_robust_get.return_value = monthly
+    fetch_nasdaq()
+
+    assert mock_robust_get.call_count > 10
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        [],
+        {"timestamp": [1]},
+        "not a list",
+        [{"timestamp": [1], "indicators": {}}],
+        [{"timestamp": [1], "indicators": {"quote": []}}],
+        [{"timestamp": [1], "indicators": {"quote": [{"close": None}]}}],
+        [{"timestamp": [1, 2], "indicators": {"quote": [{"close": [1.0]}]}}],
+    ],
+)
+def test_parse_yf_chart_rejects_malformed_results(result):
+    response = {"chart": {"result": result, "error": None}}
+    assert _parse_yf_chart(response, "ETH", "test window") is None
+
+
+def test_parse_yf_chart_masks_null_closes(mock_yf_success_response: dict):
+    ts, px = _parse_yf_chart(mock_yf_success_response, "ETH", "test window")
+    assert ts.dtype == np.int64
+    assert px.tolist() == [15000.50, 15100.75]
+    assert len(ts) == 2
+
+
 # --- Tests for cm_fetch ---
 # (These tests remain unchanged from the previous version)
 @patch("src.data_fetching.robust_get")
@@ -268,7 +407,7 @@ def test_cm_fetch_happy_path_pagination(
         series_result, expected_series, check_dtype=False, check_exact=False
     )
     assert mock_robust_get.call_count == 2
-    cache_file = manage_fetch_cache_dir / f"cm_{test_asset}_{test_metric}.parquet"
+    cache_file = manage_fetch_cache_dir / f"cm_{test_asset}_{test_metric}.feather"
     assert cache_file.exists()
     meta_file = manage_fetch_cache_dir / f"cm_{test_asset}_{test_metric}.meta.json"
     assert meta_file.exists()
@@ -288,9 +427,9 @@ def test_cm_fetch_empty_data(
     assert series_result.empty
     assert isinstance(series_result.index, pd.DatetimeIndex)
     assert mock_robust_get.call_count == 1
-    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.parquet"
+    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
     assert df_cached.columns == [test_metric]
 
@@ -309,9 +448,9 @@ def test_cm_fetch_malformed_data(
     assert series_result.empty
     assert isinstance(series_result.index, pd.DatetimeIndex)
     assert mock_robust_get.call_count == 1
-    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.parquet"
+    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
     assert df_cached.columns == [test_metric]
 
@@ -328,13 +467,63 @@ def test_cm_fetch_robust_get_exception(
     assert series_result.empty
     assert isinstance(series_result.index, pd.DatetimeIndex)
     assert mock_robust_get.call_count == 1
-    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.parquet"
+    cache_file = manage_fetch_cache_dir / f"cm_eth_{test_metric}.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
     assert df_cached.columns == [test_metric]
 
 
+@patch("src.data_fetching.robust_get")
+def test_cm_fetch_many_batches_metrics(
+    mock_robust_get: MagicMock, manage_fetch_cache_dir: Path
+):
+    """All metrics share one paginated request and are split per metric."""
+    mock_robust_get.return_value = {
+        "data": [
+            {"time": "2023-01-01T00:00:00Z", "TxCnt": "5", "SplyCur": None},
+            {"time": "2023-01-02T00:00:00Z", "TxCnt": "6", "SplyCur": "7"},
+        ],
+        "next_page_url": None,
+    }
+    result = cm_fetch_many(["TxCnt", "SplyCur"])
+
+    assert list(result) == ["TxCnt", "SplyCur"]
+    assert result["TxCnt"].name == "TxCnt"
+    assert result["TxCnt"].tolist() == [5.0, 6.0]
+    # Leading rows without a SplyCur value are trimmed from its series
+    assert result["SplyCur"].tolist() == [7.0]
+    assert mock_robust_get.call_count == 1
+    assert "metrics=TxCnt,SplyCur" in mock_robust_get.call_args.args[0]
+    assert (manage_fetch_cache_dir / "cm_eth_multi_TxCnt-SplyCur.feather").exists()
+
+
+@patch("src.data_fetching.robust_get")
+def test_cm_fetch_many_falls_back_per_metric(
+    mock_robust_get: MagicMock, manage_fetch_cache_dir: Path
+):
+    """A rejected batch is retried as one request (and cache) per metric."""
+
+    def fake_get(url: str, **_kwargs) -> dict:
+        if "metrics=TxCnt,SplyCur" in url:
+            raise RequestException("403 Forbidden")
+        metric = "TxCnt" if "metrics=TxCnt" in url else "SplyCur"
+        value = "5" if metric == "TxCnt" else "7"
+        return {
+            "data": [{"time": "2023-01-01T00:00:00Z", metric: value}],
+            "next_page_url": None,
+        }
+
+    mock_robust_get.side_effect = fake_get
+    result = cm_fetch_many(["TxCnt", "SplyCur"])
+
+    assert result["TxCnt"].iloc[0] == 5.0
+    assert result["SplyCur"].iloc[0] == 7.0
+    assert mock_robust_get.call_count == 3
+    for metric in ("TxCnt", "SplyCur"):
+        assert (manage_fetch_cache_dir / f"cm_eth_{metric}.feather").exists()
+
+
 # --- Tests for fetch_nasdaq ---
 
 
@@ -364,7 +553,7 @@ def test_fetch_nasdaq_happy_path(
     # Check robust_get was called (might be multiple times due to chunking)
     assert mock_robust_get.call_count >= 1
     # Check cache file was created
-    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.parquet"
+    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.feather"
     assert cache_file.exists()
     meta_file = manage_fetch_cache_dir / "nasdaq_ndx.meta.json"
     assert meta_file.exists()
@@ -387,9 +576,9 @@ def test_fetch_nasdaq_api_error(
     assert mock_robust_get.call_count >= 1
 
     # Cache file should exist and contain empty series
-    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.parquet"
+    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)  # Read as DataFrame
+    df_cached = pd.read_feather(cache_file)  # Read as DataFrame
     assert df_cached.empty
     assert df_cached.columns == ["nasdaq"]
 
@@ -409,9 +598,9 @@ def test_fetch_nasdaq_no_data(
     assert series_result.empty
     assert isinstance(series_result.index, pd.DatetimeIndex)
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.parquet"
+    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
     assert df_cached.columns == ["nasdaq"]
 
@@ -429,8 +618,60 @@ def test_fetch_nasdaq_robust_get_exception(
     assert series_result.empty
     assert isinstance(series_result.index, pd.DatetimeIndex)
     assert mock_robust_get.call_count >= 1
-    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.parquet"
+    cache_file = manage_fetch_cache_dir / "nasdaq_ndx.feather"
     assert cache_file.exists()
-    df_cached = pd.read_parquet(cache_file)
+    df_cached = pd.read_feather(cache_file)
     assert df_cached.empty
     assert df_cached.columns == ["nasdaq"]
+
+
+@patch("src.data_fetching.robust_get")
+def test_fetch_nasdaq_skips_chunks_before_first_trade(
+    mock_robust_get: MagicMock,
+    mock_yf_success_response: dict,
+    manage_fetch_cache_dir: Path,
+):
+    """A firstTradeDate probe stops requests for windows before the listing."""
+    first_trade = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp())
+    probe = {"chart": {"result": [{"meta": {"firstTradeDate": first_trade}}]}}
+    mock_robust_get.side_effect = lambda url, params, **_kwargs: (
+        probe if "range" in params else mock_yf_success_response
+    )
+    series_result = fetch_nasdaq()
+
+    assert len(series_result) == 2
+    requested_starts = [
+        call.kwargs["params"]["period1"]
+        for call in mock_robust_get.call_args_list
+        if "period1" in call.kwargs["params"]
+    ]
+    # Only the window containing 2023-01-01 and later ones (1985 grid) remain
+    assert requested_starts
+    assert min(requested_starts) > first_trade - 365 * 86400
+
+
+# --- Tests for fetch_all ---
+
+
+@patch("src.data_fetching.robust_get")
+def test_fetch_all_returns_every_source(
+    mock_robust_get: MagicMock,
+    mock_yf_success_response: dict,
+    mock_cm_empty_data_response: dict,
+    manage_fetch_cache_dir: Path,
+):
+    """ETH price, NASDAQ and CM metrics are fetched together and cached."""
+    mock_robust_get.side_effect = lambda url, **_kwargs: (
+        mock_cm_empty_data_response
+        if "coinmetrics" in url
+        else mock_yf_success_response
+    )
+    result = fetch_all(["TxCnt"])
+
+    assert list(result["eth_price"].columns) == ["price_usd"]
+    assert len(result["eth_price"]) == 2
+    assert result["nasdaq"].name == "nasdaq"
+    assert len(result["nasdaq"]) == 2
+    assert result["cm"]["TxCnt"].empty
+    for name in ("eth_price_yf", "nasdaq_ndx", "cm_eth_TxCnt"):
+        assert (manage_fetch_cache_dir / f"{name}.feather").exists()
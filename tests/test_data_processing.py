@@ -14,6 +14,7 @@ from src.data_processing import (
     create_daily_clean,
     create_monthly_clean,
     engineer_log_features,
+    ensure_raw_data_exists,
     load_raw_data,
     merge_eth_data,
     process_all_data,
@@ -71,12 +72,52 @@ def sample_raw_nasdaq_series() -> pd.Series:
     return series
 
 
+# --- Tests for ensure_raw_data_exists ---
+
+
+@patch("src.data_processing.fetch_all")
+def test_ensure_raw_data_exists_writes_aligned_core(
+    mock_fetch_all: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Price and CM metrics are outer-joined, forward-filled and saved."""
+    monkeypatch.setattr(settings, "DATA_DIR", tmp_path)
+    cm_dates = pd.DatetimeIndex(
+        pd.to_datetime(["2023-01-01", "2023-01-02", "2023-01-03"]), name="time"
+    )
+    mock_fetch_all.return_value = {
+        "eth_price": pd.DataFrame(
+            {"price_usd": [1200.0, 1210.0]},
+            index=pd.to_datetime(["2023-01-02", "2023-01-03"]),
+        ),
+        "cm": {
+            # SplyCur has no value on 2023-01-03; it is carried forward
+            "AdrActCnt": pd.Series([5.0, 6.0, 7.0], index=cm_dates),
+            "SplyCur": pd.Series([1e8, 2e8], index=cm_dates[:2]),
+            "TxCnt": pd.Series([1.0, 2.0, 3.0], index=cm_dates),
+            "FeeTotNtv": pd.Series([0.5, 0.6, 0.7], index=cm_dates),
+        },
+    }
+
+    assert ensure_raw_data_exists(plot_diagnostics=False)
+
+    core = pd.read_parquet(tmp_path / "eth_core.parquet").set_index("time")
+    assert core.columns.tolist() == ["price_usd", "active_addr", "supply"]
+    assert core.index.tolist() == list(cm_dates[1:])  # no price on 2023-01-01
+    assert core["supply"].tolist() == [2e8, 2e8]
+    tx = pd.read_parquet(tmp_path / "eth_tx.parquet")
+    assert tx.columns.tolist() == ["time", "tx_count"]
+    fee = pd.read_parquet(tmp_path / "eth_fee.parquet")
+    assert fee["fee_native"].tolist() == [0.5, 0.6, 0.7]
+
+
 # --- Tests for load_raw_data ---
 
 
+@patch("src.data_processing.parquet_columns", return_value=["FeeTotNtv", "time"])
 @patch("src.data_processing.load_parquet")  # Mock the utility function
 def test_load_raw_data_happy_path(
     mock_load_parquet: MagicMock,
+    mock_parquet_columns: MagicMock,
     sample_raw_core_df: pd.DataFrame,
     sample_raw_fee_df: pd.DataFrame,
     sample_raw_tx_df: pd.DataFrame,
@@ -103,6 +144,8 @@ def test_load_raw_data_happy_path(
     core_df, fee_df, tx_df = load_raw_data()
 
     assert mock_load_parquet.call_count == 3
+    # Only the fee column found in the schema is loaded
+    mock_load_parquet.assert_any_call(tmp_path / "eth_fee.parquet", ["FeeTotNtv"])
     pd.testing.assert_frame_equal(core_df, sample_raw_core_df)
     # Check that fee_df has the 'burn' column correctly renamed
     assert "burn" in fee_df.columns
@@ -126,9 +169,11 @@ def test_load_raw_data_file_not_found(
         load_raw_data()
 
 
+@patch("src.data_processing.parquet_columns", return_value=["wrong_col", "time"])
 @patch("src.data_processing.load_parquet")
 def test_load_raw_data_missing_fee_column(
     mock_load_parquet: MagicMock,
+    mock_parquet_columns: MagicMock,
     sample_raw_core_df: pd.DataFrame,
     sample_raw_tx_df: pd.DataFrame,
     tmp_path: Path,
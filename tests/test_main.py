@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from joblib import Memory
+
+import main
+from src.config import settings
+
+FRAMES = (
+    pd.DataFrame({"price_usd": [1.0]}, index=pd.to_datetime(["2023-01-01"])),
+    pd.DataFrame({"price_usd": [1.0]}, index=pd.to_datetime(["2023-01-31"])),
+)
+
+
+@pytest.fixture
+def memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Memory:
+    """A fresh joblib cache (and DATA_DIR) per test."""
+    monkeypatch.setattr(settings, "DATA_DIR", tmp_path)
+    mem = Memory(location=tmp_path / main.CACHE_DIRNAME, verbose=0)
+    monkeypatch.setattr(main, "_memory", lambda: mem)
+    return mem
+
+
+@pytest.fixture
+def src_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A throwaway src/ tree for fingerprinting."""
+    root = tmp_path / "src"
+    (root / "utils").mkdir(parents=True)
+    (root / "data_processing.py").write_text("x = 1\n")
+    (root / "utils" / "file_io.py").write_text("y = 1\n")
+    monkeypatch.setattr(main, "SRC_DIR", root)
+    main._source_fingerprint.cache_clear()
+    yield root
+    main._source_fingerprint.cache_clear()
+
+
+def test_source_fingerprint_changes_with_any_matched_file(src_dir: Path):
+    patterns = ("data_processing.py", "utils/*.py")
+    before = main._source_fingerprint(patterns)
+
+    (src_dir / "utils" / "file_io.py").write_text("y = 2\n")
+    main._source_fingerprint.cache_clear()
+
+    assert main._source_fingerprint(patterns) != before
+
+
+def test_raw_data_key_changes_with_raw_file_mtime(memory: Memory, tmp_path: Path):
+    raw_file = tmp_path / main.RAW_DATA_FILENAMES[0]
+    raw_file.write_bytes(b"raw")
+    os.utime(raw_file, (1_000_000, 1_000_000))
+    before = main._raw_data_key()
+
+    os.utime(raw_file, (2_000_000, 2_000_000))
+
+    assert main._raw_data_key() != before
+
+
+def test_raw_data_key_changes_with_processing_source(
+    memory: Memory, src_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(main, "PROCESSING_SOURCES", ("data_processing.py",))
+    before = main._raw_data_key()
+
+    (src_dir / "data_processing.py").write_text("x = 2\n")
+    main._source_fingerprint.cache_clear()
+
+    assert main._raw_data_key() != before
+
+
+@patch("src.data_processing.save_processed_data")
+@patch("src.data_processing.process_all_data", return_value=FRAMES)
+def test_load_processed_data_hit_reemits_outputs(
+    mock_process: MagicMock, mock_save: MagicMock, memory: Memory
+):
+    """The second call is served from the cache and re-writes the parquet files."""
+    first = main._load_processed_data()
+    mock_save.assert_not_called()  # process_all_data wrote them itself
+
+    second = main._load_processed_data()
+
+    mock_process.assert_called_once()
+    mock_save.assert_called_once()
+    pd.testing.assert_frame_equal(second[1], first[1])
+
+
+@patch("src.data_processing.save_processed_data")
+@patch(
+    "src.data_processing.process_all_data",
+    return_value=(pd.DataFrame(), pd.DataFrame()),
+)
+def test_load_processed_data_does_not_cache_failures(
+    mock_process: MagicMock, mock_save: MagicMock, memory: Memory
+):
+    """An empty result is dropped from the cache, so the next run retries."""
+    main._load_processed_data()
+    main._load_processed_data()
+
+    assert mock_process.call_count == 2
+    mock_save.assert_not_called()
+
+
+@patch("src.validation.run_oos_validation", return_value={"oos_rmse": 1.0})
+def test_oos_memo_reruns_when_code_key_changes(mock_oos: MagicMock, memory: Memory):
+    cached = memory.cache(main._oos_validation_keyed)
+    frame = pd.DataFrame({"price_usd": [1.0, 2.0]})
+
+    cached("code-v1", df_monthly=frame, window_size=60)
+    cached("code-v1", df_monthly=frame, window_size=60)
+    assert mock_oos.call_count == 1
+
+    cached("code-v2", df_monthly=frame, window_size=60)
+    assert mock_oos.call_count == 2
+    mock_oos.assert_called_with(df_monthly=frame, window_size=60)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_run_stages_returns_results_by_name(parallel: bool):
+    """In-process and pooled runs hand back the same results."""
+    tasks = {
+        "div": (divmod, (7, 2), {}),
+        "sort": (sorted, ([3, 1, 2],), {"reverse": True}),
+    }
+
+    assert main._run_stages(tasks, parallel=parallel) == {
+        "div": (3, 1),
+        "sort": [3, 2, 1],
+    }
+
+
+@patch("main.ProcessPoolExecutor")
+def test_run_stages_skips_pool_when_not_parallel(mock_pool: MagicMock):
+    main._run_stages({"div": (divmod, (7, 2), {})}, parallel=False)
+
+    mock_pool.assert_not_called()
@@ -0,0 +1,122 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.utils.json_compat as json_compat
+from src.reporting import write_results_json
+
+RESULTS = {
+    "ols_base_r2": np.float64(0.97),
+    "oos_n_predictions": np.int64(48),
+    "ols_ext_pvals_hac": {"const": np.float64(1e-5), "log_active": 0.01},
+    "last_date": pd.Timestamp("2024-12-31"),
+    "residuals": np.array([1.0, np.nan, -2.5]),
+}
+
+EXPECTED = {
+    "ols_base_r2": 0.97,
+    "oos_n_predictions": 48,
+    "ols_ext_pvals_hac": {"const": 1e-5, "log_active": 0.01},
+    "last_date": "2024-12-31T00:00:00",
+    "residuals": [1.0, None, -2.5],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_results_json_matches_npencoder(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+):
+    """The orjson and stdlib paths serialize numpy/pandas values alike."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_compat, "orjson", None)
+
+    out = tmp_path / "final_results.json"
+    write_results_json(RESULTS, out)
+
+    assert json.loads(out.read_text()) == EXPECTED
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_results_json_nulls_float_nan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+):
+    """Bare and nested NaN/Inf floats become JSON null with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_compat, "orjson", None)
+
+    out = tmp_path / "final_results.json"
+    write_results_json(
+        {
+            "rmse": np.nan,
+            "p": np.float64(np.inf),
+            "pvals": {"const": float("-inf"), "x": 0.5},
+            "ci": (np.nan, 1.0),
+        },
+        out,
+    )
+
+    assert json.loads(out.read_text()) == {
+        "rmse": None,
+        "p": None,
+        "pvals": {"const": None, "x": 0.5},
+        "ci": [None, 1.0],
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_results_json_normalizes_numpy_bool_and_datetime64(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+):
+    """np.bool_ and datetime64 (scalars, arrays, NaT) encode alike on both paths."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_compat, "orjson", None)
+
+    out = tmp_path / "final_results.json"
+    write_results_json(
+        {
+            "reject": np.bool_(True),
+            "flags": {"stationary": np.bool_(False)},
+            "break_date": np.datetime64("2020-05-01"),
+            "dates": np.array(["2024-01-31", "NaT"], dtype="datetime64[ns]"),
+        },
+        out,
+    )
+
+    assert json.loads(out.read_text()) == {
+        "reject": True,
+        "flags": {"stationary": False},
+        "break_date": "2020-05-01T00:00:00",
+        "dates": ["2024-01-31T00:00:00", None],
+    }
+
+
+def test_write_results_json_encodes_frames_in_split_orient(tmp_path: Path):
+    """DataFrame values are written via pandas' split-orient JSON."""
+    preds = pd.DataFrame(
+        {"predicted_price_oos": [1.5, np.nan]},
+        index=pd.to_datetime(["2024-01-31", "2024-02-29"]),
+    )
+    out = tmp_path / "final_results.json"
+    write_results_json({"n": 2, "predictions_df": preds}, out)
+
+    loaded = json.loads(out.read_text())
+    assert loaded["n"] == 2
+    assert loaded["predictions_df"]["columns"] == ["predicted_price_oos"]
+    assert loaded["predictions_df"]["data"] == [[1.5], [None]]
+    assert loaded["predictions_df"]["index"][0].startswith("2024-01-31")
+
+
+def test_write_results_json_empty_dict(tmp_path: Path):
+    out = tmp_path / "final_results.json"
+    write_results_json({}, out)
+
+    assert json.loads(out.read_text()) == {}
@@ -0,0 +1,47 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+import src.utils.json_compat as json_compat
+from src.utils.api_helpers import robust_get
+
+
+def _response(body: bytes) -> MagicMock:
+    resp = MagicMock(spec=requests.Response)
+    resp.status_code = 200
+    resp.content = body
+    resp.text = body.decode()
+    resp.json.side_effect = lambda: json.loads(body)
+    return resp
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@patch("src.utils.api_helpers.session.get")
+def test_robust_get_decodes_json_body(
+    mock_session_get: MagicMock, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    """The orjson and stdlib decode paths return the same object."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_compat, "orjson", None)
+    mock_session_get.return_value = _response(b'{"data": [{"v": "1.5"}], "n": null}')
+
+    assert robust_get("http://ok.example") == {"data": [{"v": "1.5"}], "n": None}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@patch("src.utils.api_helpers.session.get")
+def test_robust_get_invalid_json_raises_value_error(
+    mock_session_get: MagicMock, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_compat, "orjson", None)
+    mock_session_get.return_value = _response(b"<html>rate limited</html>")
+
+    with pytest.raises(ValueError, match="not valid JSON"):
+        robust_get("http://bad.example")
@@ -0,0 +1,49 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+import src.utils.api_helpers as api_helpers
+from src.utils.api_helpers import _TokenBucket, robust_get
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    """Capacity tokens go out at once; the next one waits ~1/rate seconds."""
+    bucket = _TokenBucket(rate=20.0, capacity=3.0)
+    t0 = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - t0 < 0.03
+
+    bucket.acquire()
+    assert time.monotonic() - t0 >= 0.04
+
+
+def test_token_bucket_penalty_holds_back_callers():
+    bucket = _TokenBucket(rate=1000.0, capacity=10.0)
+    bucket.penalty(0.1)
+    t0 = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - t0 >= 0.09
+
+
+@patch("src.utils.api_helpers.session.get")
+def test_robust_get_429_applies_retry_after_to_host_bucket(
+    mock_session_get: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A final 429 raises HTTPError and slows the whole host down by Retry-After."""
+    monkeypatch.setattr(api_helpers, "_buckets", {})
+    resp = MagicMock(spec=requests.Response)
+    resp.status_code = 429
+    resp.headers = {"Retry-After": "30"}
+    resp.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        "429 Client Error: Too Many Requests", response=resp
+    )
+    mock_session_get.return_value = resp
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        robust_get("http://throttled.example/api")
+
+    bucket = api_helpers._buckets["throttled.example"]
+    assert bucket._not_before - time.monotonic() > 25
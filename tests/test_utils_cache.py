@@ -96,3 +96,59 @@ def test_disk_cache_lock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
 
     # There should be at least one attempt to acquire the lock
     assert acquired["count"] >= 1
+
+
+# -----------------------------------------------------------------------------
+# 4. Float columns are written ZSTD + BYTE_STREAM_SPLIT and round-trip exactly
+# -----------------------------------------------------------------------------
+
+
+def test_disk_cache_parquet_encoding(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(settings, "DATA_DIR", tmp_path)
+    frame = pd.DataFrame(
+        {"price_usd": [1800.25, 1801.5, None], "label": ["a", "b", "a"]},
+        index=pd.to_datetime(["2023-01-01", "2023-01-02", "2023-01-03"]),
+    )
+
+    @disk_cache("encoded.parquet", max_age_hr=24)
+    def produce():
+        return frame
+
+    produce()
+    pd.testing.assert_frame_equal(produce(), frame, check_freq=False)
+
+    meta = pq.ParquetFile(tmp_path / "encoded.parquet").metadata.row_group(0)
+    columns = {meta.column(i).path_in_schema: meta.column(i) for i in range(3)}
+    assert columns["price_usd"].compression == "ZSTD"
+    assert "BYTE_STREAM_SPLIT" in columns["price_usd"].encodings
+    assert "RLE_DICTIONARY" in columns["label"].encodings
+
+
+# -----------------------------------------------------------------------------
+# 5. A .feather suffix stores the result as Arrow IPC
+# -----------------------------------------------------------------------------
+
+
+def test_disk_cache_feather_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "DATA_DIR", tmp_path)
+    calls = {"count": 0}
+    series = pd.Series(
+        [1800.25, None],
+        index=pd.to_datetime(["2023-01-01", "2023-01-02"]),
+        name="price_usd",
+    )
+
+    @disk_cache("small.feather", max_age_hr=24)
+    def produce():
+        calls["count"] += 1
+        return series
+
+    produce()
+    cached = produce()
+
+    assert calls["count"] == 1
+    pd.testing.assert_series_equal(cached, series, check_freq=False)
+    pd.testing.assert_frame_equal(
+        pd.read_feather(tmp_path / "small.feather"), series.to_frame()
+    )
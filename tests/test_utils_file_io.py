@@ -3,7 +3,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from src.utils.file_io import load_parquet
+from src.utils.file_io import load_parquet, save_parquet, save_series_parquet
 
 
 def test_load_parquet_happy_path(tmp_path: Path):
@@ -59,3 +59,55 @@ def test_load_parquet_missing_required_column(tmp_path: Path):
     # Assert the exact error message string
     expected_msg = f"{file_path.name} missing required columns: ['value2']"
     assert str(excinfo.value) == expected_msg
+
+
+def test_save_parquet_round_trips_with_zstd(tmp_path: Path):
+    """save_parquet writes ZSTD and load_parquet reads it back unchanged."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "saved.parquet"
+    df = pd.DataFrame(
+        {
+            "time": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "value": [1.5, 2.5],
+        }
+    )
+
+    save_parquet(df, file_path, index=False)
+
+    pd.testing.assert_frame_equal(load_parquet(file_path), df.set_index("time"))
+    meta = pq.ParquetFile(file_path).metadata.row_group(0)
+    assert {meta.column(i).compression for i in range(2)} == {"ZSTD"}
+
+
+def test_save_series_parquet_round_trips(tmp_path: Path):
+    """A named Series is written as 'time' + value columns and reads back."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "series.parquet"
+    series = pd.Series(
+        [10.0, 12.5],
+        index=pd.to_datetime(["2023-01-01", "2023-01-02"]),
+        name="fee_native",
+    )
+
+    save_series_parquet(series, file_path)
+
+    assert pq.read_schema(file_path).names == ["time", "fee_native"]
+    loaded = load_parquet(file_path, req_cols=["fee_native"])["fee_native"]
+    pd.testing.assert_series_equal(loaded, series, check_names=False, check_freq=False)
+
+
+def test_load_parquet_reads_only_required_columns(tmp_path: Path):
+    """With req_cols, other columns in the file are not loaded."""
+    file_path = tmp_path / "wide.parquet"
+    pd.DataFrame(
+        {
+            "time": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "value1": [1, 2],
+            "unused": ["a", "b"],
+        }
+    ).to_parquet(file_path)
+
+    loaded_df = load_parquet(file_path, req_cols=["value1"])
+
+    assert loaded_df.columns.tolist() == ["value1"]
+    assert isinstance(loaded_df.index, pd.DatetimeIndex)
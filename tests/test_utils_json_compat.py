@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import src.utils.json_compat as json_compat
+from src.utils.json_compat import dumps, loads
+
+DOC = {
+    "title": "Δ-audit ❸",
+    "z": 1,
+    "a": [1.5, float("nan"), np.float64(np.inf)],
+    "nested": {"ok": True, "none": None},
+}
+
+
+def _dumps_both(monkeypatch: pytest.MonkeyPatch, **kwargs) -> tuple[str, str]:
+    fast = dumps(DOC, **kwargs)
+    monkeypatch.setattr(json_compat, "orjson", None)
+    return fast, dumps(DOC, **kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"indent": True}, {"sort_keys": True}], ids=str)
+def test_dumps_matches_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, kwargs: dict
+):
+    """orjson and the stdlib fallback write byte-identical text."""
+    pytest.importorskip("orjson")
+    fast, fallback = _dumps_both(monkeypatch, **kwargs)
+
+    assert fast == fallback
+    assert "Δ-audit ❸" in fallback  # raw UTF-8, no \u escapes
+
+
+def test_dumps_writes_nonfinite_floats_as_null(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(json_compat, "orjson", None)
+
+    assert loads(dumps(DOC))["a"] == [1.5, None, None]
+
+
+def test_dumps_keeps_insertion_order_unless_sorted(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(json_compat, "orjson", None)
+
+    assert list(loads(dumps(DOC))) == ["title", "z", "a", "nested"]
+    assert list(loads(dumps(DOC, sort_keys=True))) == ["a", "nested", "title", "z"]
+
+
+def test_import_does_not_load_heavy_utils():
+    """The scripts import json_compat; that must not pull in pandas/requests."""
+    code = (
+        "import sys, src.utils.json_compat; "
+        "print(any(m in sys.modules for m in ('pandas', 'requests', 'pydantic')))"
+    )
+    root = Path(__file__).resolve().parents[1]
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=root, capture_output=True, text=True
+    )
+
+    assert out.stdout.strip() == "False", out.stderr